@@ -0,0 +1,170 @@
+"""
+Headless benchmark for the EditableTable, no browser or remi server needed.
+
+Builds tables of increasing size from a list[list] and from a DataFrame and measures per operation the wall time,
+the peak memory (tracemalloc) and the size of the html remi would send to the browser (the initial page for a full
+load, the update for all other operations). The results are stored in a json file, compare two runs with --compare.
+Creating the widgets dominates a full load, 100k rows without virtual mode take minutes (more with tracemalloc).
+
+Examples:
+	| python benchmarks/EditableTable_bench.py --rows 100 1000 10000
+	| python benchmarks/EditableTable_bench.py --rows 1000 --mode rows columnar virtual --compare benchmarks/results/old.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# remi_addons imports common_utils as a top level module
+sys.path[:0] = [BASE_DIR, os.path.join(BASE_DIR, 'common_addons')]
+
+import remi
+from common_addons.remi_addons import EditableTable
+
+ROW_COUNTS = [100, 1000, 10000, 100000]
+MODES = {'rows': {}, 'columnar': {'columnar': True}, 'virtual': {'virtual_rows': 30}}
+HEADER = ['ID', 'Enabled', 'Name', 'Value', 'Group']
+
+
+def make_data(row_count: int, source: str):
+	""" Returns a table with row_count datarows as list[list] (title row first) or as DataFrame"""
+	rows = [[x, x % 3 == 0, f'name {(x * 7919) % row_count}', (x * 31 % 1000) / 10, f'group {x % 10}']
+			for x in range(row_count)]
+	if source == 'dataframe': return pd.DataFrame(rows, columns=HEADER)
+	return [list(HEADER)] + rows
+
+
+def payload_size(table: EditableTable) -> int:
+	""" The size in bytes of the html of all changed widgets, as remi would send it to the browser"""
+	changed_widgets = {}
+	table.repr(changed_widgets)
+	return sum(len(html.encode('utf-8')) for html in changed_widgets.values())
+
+
+def measure(operation, table_func, memory: bool = True) -> dict:
+	"""
+	Runs an operation and measures it
+	:param operation: 	callable doing the work, returns the table
+	:param table_func: 	callable returning the table for the payload size
+	:param memory: 		Measure the peak memory, tracemalloc slows the operation down
+	:return: dict with seconds, peak_memory (bytes, None without memory) and payload (bytes)
+	"""
+	if memory:
+		tracemalloc.start()
+		tracemalloc.reset_peak()
+	start = time.perf_counter()
+	operation()
+	seconds = time.perf_counter() - start
+	peak_memory = None
+	if memory:
+		peak_memory = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+	return {'seconds': seconds, 'peak_memory': peak_memory, 'payload': payload_size(table_func())}
+
+
+def bench_table(row_count: int, source: str, mode: str, memory: bool = True) -> dict:
+	""" Runs all operations on one table, returns per operation the measurements"""
+	data = make_data(row_count, source)
+	holder = {}
+	results = {}
+
+	def load():
+		holder['table'] = EditableTable(**MODES[mode])
+		holder['table'].set_data(data, editable=['Enabled', 'Name'], toggle=['Enabled'])
+
+	def refresh():
+		# the same data with one changed cell, as a periodic refresh would do
+		if source == 'dataframe':
+			new_data = data.copy()
+			new_data.iat[0, 3] = -1.0
+		else:
+			new_data = [list(row) for row in data]
+			new_data[1][3] = -1.0
+		holder['table'].set_data(new_data, update_only=True)
+
+	def edit():
+		# as the browser does it, through the onchange event of the input of the cell
+		holder['table'].item_at(1, 2).editInput.onchange('edited')
+
+	table = lambda: holder['table']
+	results['set_data'] = measure(load, table, memory)
+	results['sort'] = measure(lambda: table().on_table_row_click(table().children['0'], table().item_at(0, 2)), table, memory)
+	results['sort_reverse'] = measure(lambda: table().on_table_row_click(table().children['0'], table().item_at(0, 2)), table, memory)
+	results['refresh'] = measure(refresh, table, memory)
+	results['toggle'] = measure(lambda: table().on_toggle(None, 0, 1), table, memory)
+	results['edit'] = measure(edit, table, memory)
+	results['get_data'] = measure(lambda: table().get_data(), table, memory)
+	results['get_dataframe'] = measure(lambda: table().get_data(as_dataframe=True), table, memory)
+	return results
+
+
+def git_revision():
+	try:
+		return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, capture_output=True,
+							  text=True, check=True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+
+def compare(results: list, old_file: str):
+	""" Prints the time and payload ratios (new / old) of the measurements both runs have"""
+	with open(old_file) as f:
+		old_results = {(x['rows'], x['source'], x['mode']): x['operations'] for x in json.load(f)['results']}
+	print(f'\ncompared with {old_file} (new / old)')
+	for result in results:
+		old = old_results.get((result['rows'], result['source'], result['mode']))
+		if old is None: continue
+		for operation, new_values in result['operations'].items():
+			if operation not in old: continue
+			time_ratio = new_values['seconds'] / old[operation]['seconds'] if old[operation]['seconds'] else float('nan')
+			flag = '  <-- slower' if time_ratio > 1.2 else ''
+			print(f"{result['rows']:>7} {result['source']:<9} {result['mode']:<8} {operation:<14} "
+				  f"time {time_ratio:6.2f}  payload {new_values['payload']:>10} / {old[operation]['payload']:<10}{flag}")
+
+
+def main():
+	parser = argparse.ArgumentParser(description='Headless EditableTable benchmark')
+	parser.add_argument('--rows', type=int, nargs='+', default=ROW_COUNTS, help='row counts to benchmark')
+	parser.add_argument('--source', nargs='+', default=['list', 'dataframe'], choices=['list', 'dataframe'])
+	parser.add_argument('--mode', nargs='+', default=['rows'], choices=list(MODES))
+	parser.add_argument('--no-memory', action='store_true', help='skip the peak memory measurement (faster)')
+	parser.add_argument('--output', default=os.path.join(BASE_DIR, 'benchmarks', 'results'),
+						help='directory (or json file) for the results')
+	parser.add_argument('--compare', help='json file of an earlier run to compare with')
+	args = parser.parse_args()
+
+	results = []
+	for row_count in args.rows:
+		for source in args.source:
+			for mode in args.mode:
+				operations = bench_table(row_count, source, mode, memory=not args.no_memory)
+				results.append({'rows': row_count, 'source': source, 'mode': mode, 'operations': operations})
+				for operation, values in operations.items():
+					memory = f"{values['peak_memory'] / 1e6:9.2f} MB" if values['peak_memory'] is not None else ''
+					print(f"{row_count:>7} {source:<9} {mode:<8} {operation:<14} {values['seconds'] * 1000:10.2f} ms"
+						  f"{memory} {values['payload']:>10} bytes")
+
+	run = {'timestamp': datetime.now().isoformat(timespec='seconds'), 'revision': git_revision(),
+		   'python': platform.python_version(), 'remi': getattr(remi, '__version__', None),
+		   'pandas': pd.__version__, 'results': results}
+	output = args.output
+	if not output.endswith('.json'):
+		os.makedirs(output, exist_ok=True)
+		output = os.path.join(output, f"EditableTable_{datetime.now():%Y%m%d_%H%M%S}_{run['revision'] or 'unknown'}.json")
+	with open(output, 'w') as f:
+		json.dump(run, f, indent=1)
+	print(f'results stored in {output}')
+
+	if args.compare: compare(results, args.compare)
+
+
+if __name__ == '__main__':
+	main()
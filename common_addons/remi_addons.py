@@ -1,33 +1,65 @@
+import contextlib
 import copy
+import functools
+import html
+import logging
+import operator
+import threading
+import time
 from argparse import ArgumentError
+from bisect import bisect_left, bisect_right
 from collections import ChainMap
-from typing import Union
+from typing import Union, Callable
 
 import remi.gui as gui
 import remi
 from common_utils import update_css_stylestr, AttrDict, Waitkey, dump
 from remi import TableTitle
-from remi.gui import decorate_event, decorate_set_on_listener
+from remi.gui import decorate_event, decorate_event_js, decorate_set_on_listener
 
 from pygal import Config, DateTimeLine, Line
 from pygal.style import Style
 
 import markdown
 from textwrap import dedent
+import numpy as np
 import pandas as pd
 
+# private, so from common_addons import * does not replace the logger of the application
+_logger = logging.getLogger(__name__)
+
+
+def _get_app(widget):
+	""" Returns the remi App showing the widget (the parent of the root widget), None when not on a page"""
+	while isinstance(widget, gui.Tag): widget = widget.get_parent()
+	return widget
+
 
 class EditableTable(gui.Table):
 	"""
 	Simplified version of the Remi table widget.
 	"""
 	
-	def __init__(self, theme='theme1', sort_on_title_click=True, **kwargs):
+	def __init__(self, theme='theme1', sort_on_title_click=True, virtual_rows: int = 0, overscan: int = 5,
+				 row_height: int = 30, columnar: bool = False, max_rows: int = 0, batch_window: float = 0, **kwargs):
 		"""
 		:param args: See gui.Container.__init__()
 
 		:param theme:					Specify a specific CSS theme, default empty string (equals theme1)
 		:param sort_on_title_click: 	Sort the table when the title row is clicked
+		:param virtual_rows:			Number of visible datarows in virtual scrolling mode, 0 (default) renders all rows.
+										In virtual mode only a window of rows is created as widgets, the window slides
+										over the table_data when the user scrolls the table.
+		:param overscan:				(virtual mode) Number of extra rows materialized above and below the visible window
+		:param row_height:				(virtual mode) Fixed height of a row in pixels, used to translate scroll positions
+		:param columnar:				Keep the table data per column in NumPy arrays (see ColumnarTableData) instead of
+										a list per row. Saves a lot of memory on large numeric tables and makes sorting,
+										get_data and toggling vectorized operations.
+		:param max_rows:				Keep at most this many datarows when rows are added with append_row or prepend_row,
+										the oldest rows are dropped. 0 (default) keeps all rows.
+		:param batch_window:			Collect the edits of the user for this many seconds (every edit restarts the
+										window) and pass them together to the on_items_changed event. 0 (default)
+										disables the on_items_changed event, the edits are tracked anyway (get_changes).
 		:keyword style:					Sets the style of the table parent object
 		"""
 		self.__column_count = 0
@@ -38,15 +70,49 @@ class EditableTable(gui.Table):
 		# if self.sort_on_title_click:
 		# self.on_table_row_click.connect(self.on_table_row_click)
 		
+		self.virtual_rows = virtual_rows
+		self.overscan = overscan
+		self.row_height = row_height
+		self._window_start = 0
+		""" (virtual mode) number of datarows before the first materialized row"""
+		if self.virtual_rows:
+			# the table becomes its own scroll container, the title row sticks to the top (see css)
+			self.add_class('virtual')
+			self.css_display = 'block'
+			self.style['overflow-y'] = 'auto'
+			if 'height' not in self.style: self.style['height'] = f'{(self.virtual_rows + 1) * self.row_height}px'
+			self.on_scroll.connect(None)
+		
 		self.row_count = 0
 		self.column_count = 0
 		self.sort_item = None
+		self._sort_keys = []
+		""" The active sort, list of (column number, descending) tuples, the first one is the primary sort"""
+		self._sorter = TableSorter()
+		self._base_rows = []
+		
+		self._item_index = {}
+		""" per id() of a cell widget: (TableRow, column number), the TableRow holds the actual row_number"""
+		self._column_index = {}
+		""" per column title: column number"""
+		
+		self.columnar = columnar
+		self.max_rows = max_rows
+		self.batch_window = batch_window
+		self._changes = {}
+		""" The dirty cells, per (id of the datarow, column number): [datarow, column number, original value, new value]"""
+		self._batch = {}
+		""" (batch_window) The edits in the current batch window, just like _changes"""
+		self._batch_timer = None
+		self._batch_lock = threading.Lock()
+		self._store = None
+		""" (columnar mode) The ColumnarTableData holding the data"""
 		
 		self.table_data = []
 		""" The internally used table_data list including tooltips and index"""
 		
 		self.initial_list = []
-		""" initially loaded list, used for reset/cancel purpose"""
+		""" initially loaded list or DataFrame, used for reset/cancel purpose"""
 		
 		self.editable = []
 		self._editable_check = []
@@ -57,14 +123,36 @@ class EditableTable(gui.Table):
 		self.tooltips = []
 		self.tip_type = 'item'
 		self.tt_style = ''
+		self.lazy_tooltips = False
 		self.rowdata_links = []
+		self._initial_tooltips = None
+		self._initial_rowdata_links = []
 		
 		self.btn_columns = {}
+		
+		self.cond_formats = {}
+		self._cond_formatters = {}
+		""" per column number: Conditional_Format_MixIn with the compiled rules of the column"""
+		self._cond_styles = {}
+		""" per column number: array with per TableRow (key - 1) the style value the cell has now, None for none"""
+		
+		self._source = None
+		""" (paginated mode) The data source callable, see set_source"""
+		self._source_header = []
+		self._source_options = {}
+		self.page_size = 0
+		self.page = 0
+		self.total_rows = 0
+		self.prefetch = True
+		self._page_cache = {}
+		""" (paginated mode) per (page, sort column, descending): prefetched (rows, total_count)"""
+		self._prefetch_threads = {}
 	
 	def set_data(self, table_data: Union[list[list], pd.DataFrame],
 				 tooltips: Union[list[list[str]], pd.DataFrame] = None, editable: list[str] = None,
 				 toggle: list[str] = None, buttons: dict = None,
-				 tip_type: str = 'item', tt_style: str = '', update_only=False, rowdata_links: list = None, **kwargs):
+				 tip_type: str = 'item', tt_style: str = '', update_only=False, rowdata_links: list = None,
+				 copy_data: bool = True, lazy_tooltips: bool = False, cond_formats: dict = None, **kwargs):
 		"""
 			Normal way to fill the table after the constructor.
 			The table is build from a List of Lists (All rows MUST have equal length and first row is header/title row),
@@ -92,6 +180,20 @@ class EditableTable(gui.Table):
 									accessible through Tablerow data_link attribute. and Tableitem data_link attribute.
 									When providing this list make sure there is also a rowdata_link for the title row provided...
 									if nothing is provided None will be used
+			:param copy_data:		True (default): the table keeps a private copy of table_data as reset/cancel snapshot.
+									False: the passed list or DataFrame itself becomes the snapshot and is shared with the
+									table, the caller promises not to change it afterwards. Saves a complete copy of the
+									data on every load. The rows of the table itself are always private, in columnar mode
+									a column is copied the first time it is changed (copy-on-write).
+			:param lazy_tooltips:	Do not create a tooltip widget for every cell, the tooltips are stored as data
+									in the cells and one shared tooltip element per table shows the tooltip of the
+									cell (or row) the mouse is over. Saves a widget per cell with a tooltip.
+			:param cond_formats:	Conditional formatting of the cells per column, with the rules of the
+									Conditional_Format_MixIn. The rules are evaluated for the whole column at once, only
+									the cells that get another style value are updated.
+									format: cond_formats={'col_name':{'property':'background-color', 'cond_formats':[
+												{'cond':'gt', 'check_value':20, 'true':'red', 'qit':True}, ...]}}
+									property defaults to color
 
 			:return:
 
@@ -108,11 +210,16 @@ class EditableTable(gui.Table):
 
 		"""
 		
+		# Only the reset/cancel snapshot (initial_list) needs a private copy, the rows of the table_data are new
+		# lists anyway and the columnar store copies a column before it changes it
 		if type(table_data) is list:
-			data = copy.deepcopy(table_data)
+			data = copy.deepcopy(table_data) if copy_data and not update_only else table_data
+			header = data[0]
+			row_count = len(data)
 		elif type(table_data) is pd.DataFrame:
 			header = table_data.columns.tolist()
-			data = [header] + table_data.values.tolist()
+			data = table_data.copy() if copy_data and not update_only else table_data
+			row_count = len(table_data) + 1
 		else:
 			raise TypeError(f'Table list should be of type list or DataFrame.. not {type(table_data)}')
 		
@@ -121,11 +228,12 @@ class EditableTable(gui.Table):
 			self.initial_list = data
 			
 			# determine the table dimensions and check table validity
-			max_columns = max(map(len, data))
-			min_columns = min(map(len, data))
-			if max_columns != min_columns: raise ValueError('Passed table rows must have identical column count...')
-			self.column_count = max_columns
-			self.row_count = len(data)
+			if type(data) is list:
+				max_columns = max(map(len, data))
+				min_columns = min(map(len, data))
+				if max_columns != min_columns: raise ValueError('Passed table rows must have identical column count...')
+			self.column_count = len(header)
+			self.row_count = row_count
 			# if len(data) > 1:
 			# 	self.column_types = [type(x) for x in data[1][:self.column_count]]
 			# else:
@@ -137,46 +245,94 @@ class EditableTable(gui.Table):
 			# 			raise TypeError(f'{data[0][teller]}--All values in 1 column should be of the same type...')
 			
 			# pre-checks and conversions
-			if tooltips is None: tooltips = [[]]
-			if type(tooltips) is pd.DataFrame and tooltips.empty: tooltips = [[]]
+			if type(tooltips) is pd.DataFrame and tooltips.empty: tooltips = None
 			if type(tooltips) is pd.DataFrame: tooltips = tooltips.values.tolist()
-			tooltips = self._re_dim(tooltips, self.row_count, self.column_count)
+			if tooltips is not None or not self.columnar:
+				# the columnar store does not need a list full of None's when there are no tooltips
+				tooltips = self._re_dim(tooltips if tooltips is not None else [[]], self.row_count, self.column_count)
 			
 			# store arguments like editable, the tooltips, type and style for reset/cancel purposes
 			self.editable = editable if editable is not None else []
-			self._editable_check = [data[0][x] in self.editable for x in range(self.column_count)]
+			self._editable_check = [header[x] in self.editable for x in range(self.column_count)]
 			self.toggle = toggle if toggle is not None else []
-			self._toggle_check = [data[0][x] in self.toggle for x in range(self.column_count)]
+			self._toggle_check = [header[x] in self.toggle for x in range(self.column_count)]
 			
 			self.buttons = buttons if buttons is not None else {}
-			self._button_check = [data[0][x] in self.buttons for x in range(self.column_count)]
-			self._button_hndlr = [self.buttons.get(data[0][x], {}).get('hndlr', None) for x in range(self.column_count)]
-			self._button_symb = [self.buttons.get(data[0][x], {}).get('symbol', '') for x in range(self.column_count)]
-			self._button_style = [self.buttons.get(data[0][x], {}).get('style', '') for x in range(self.column_count)]
+			self._button_check = [header[x] in self.buttons for x in range(self.column_count)]
+			self._button_hndlr = [self.buttons.get(header[x], {}).get('hndlr', None) for x in range(self.column_count)]
+			self._button_symb = [self.buttons.get(header[x], {}).get('symbol', '') for x in range(self.column_count)]
+			self._button_style = [self.buttons.get(header[x], {}).get('style', '') for x in range(self.column_count)]
 
-			self.rowdata_links = [None for x in range(len(self.initial_list))]
+			self.rowdata_links = [None for x in range(self.row_count)]
 			if rowdata_links is not None: self.rowdata_links = self.rowdata_links[:-len(rowdata_links)] + rowdata_links
 
 			self.tooltips = tooltips
+			# append_row and friends change the lists above, reset goes back to the lists of the snapshot
+			self._initial_tooltips = list(tooltips) if tooltips is not None else None
+			self._initial_rowdata_links = list(self.rowdata_links)
 			self.tip_type = tip_type
 			self.tt_style = tt_style
+			self.lazy_tooltips = lazy_tooltips
+			self._set_tooltip_events()
+			
+			self.cond_formats = cond_formats if cond_formats is not None else {}
+			self._cond_formatters = {c: Conditional_Format_MixIn(None, self.cond_formats[header[c]].get('property', 'color'),
+																 self.cond_formats[header[c]]['cond_formats'])
+									 for c in range(self.column_count) if header[c] in self.cond_formats}
+			self._cond_styles = {}
 			# start with a clean empty table, reset the sort
 			self.sort_item = None
+			self._sort_keys = []
 			self._reverse_sort = [True for x in range(self.column_count)]
+			self._window_start = 0
 			self.empty()
+			self._item_index = {}
 		
-		# construct a data structure with the table_data, the tooltips and an index (to store the original sort sequence)
-		self.table_data = [data[x] + self.tooltips[x] + [self.rowdata_links[x]] + [x] for x in range(len(data))]
-		
+		if update_only:
+			# a refresh keeps the edits of the user, a pending batch is passed on before its datarows are replaced
+			self.flush_changes()
+		else:
+			# the edits were made to data that is replaced now
+			with self._batch_lock:
+				if self._batch_timer is not None: self._batch_timer.cancel()
+				self._batch_timer = None
+				self._changes = {}
+				self._batch = {}
 		
-		if update_only and self.sort_item:
-			# re-create the pre-existing sort in the table
-			sorted_data = sorted(self.table_data[1:], key=lambda x: x[self.sort_item.column_number],
-								 reverse=self._reverse_sort[self.sort_item.column_number])
-			sorted_data = [self.table_data[0]] + sorted_data
-			self.table_data = sorted_data
+		# the first column with a title wins, just like a search from left to right would
+		self._column_index = {}
+		for c in range(self.column_count): self._column_index.setdefault(f'{header[c]}', c)
 		
-		self._build_table()
+		old_table_data = self.table_data
+		if self.columnar:
+			# the datarows in table_data are light weight views on the columns of the store
+			self._store = ColumnarTableData(data, self.tooltips, self.rowdata_links)
+			self.table_data = self._store.table_data()
+		elif type(data) is pd.DataFrame:
+			# the rows from values.tolist() are new lists, extend them in place instead of building every row twice
+			self.table_data = [list(header)] + data.values.tolist()
+			for x, row in enumerate(self.table_data):
+				row.extend(self.tooltips[x])
+				row.append(self.rowdata_links[x])
+				row.append(x)
+		else:
+			# construct a data structure with the table_data, the tooltips and an index (to store the original sort sequence)
+			self.table_data = [data[x] + self.tooltips[x] + [self.rowdata_links[x]] + [x] for x in range(len(data))]
+		# the datarows in their original sequence, all sort permutations refer to this list
+		old_base_rows, self._base_rows = self._base_rows, self.table_data[1:]
+		if update_only and self._source is None: self._carry_changes(old_base_rows)
+		self._sorter.clear()
+
+
+		if update_only and self._sort_keys and self._source is None:
+			# re-create the pre-existing sort in the table, in paginated mode the data source did the sorting
+			self._apply_sort()
+
+		if update_only and len(old_table_data) == len(self.table_data):
+			# only touch the cells that actually changed, remi will then only push those to the browser
+			self._build_table(changed_cells=self._diff_table_data(old_table_data, self.table_data))
+		else:
+			self._build_table()
 	
 	def get_data(self, as_dataframe: bool = False) -> Union[list[list], pd.DataFrame]:
 		"""
@@ -185,40 +341,369 @@ class EditableTable(gui.Table):
 		:param as_dataframe: Return result as a dataframe, column names from title row
 		:return: list[list] or pd.DataFrame
 		"""
-		result = []
-		# build a list with rows that only contain the columns of the original list and the index
-		result = [row[:self.column_count] + [row[-1]] for row in self.table_data]
-		# Now sort the rows as they show up in the index sequence
-		result = sorted(result, key=lambda x: x[-1], reverse=False)
-		# now remove the index column (last column)
-		result = [row[:-1] for row in result]
+		if self.columnar:
+			# the store keeps the columns in the original sequence, no need to sort
+			return self._store.to_dataframe() if as_dataframe else self._store.to_list()
+		
+		# the datarows in their original sequence, no need to sort on the index
+		result = [row[:self.column_count] for row in [self.table_data[0]] + self._base_rows]
 		
 		if as_dataframe:
 			result = pd.DataFrame(data=result[1:], columns=result[0])
 		
 		return result
 	
-	def _build_table(self):
+	def set_source(self, source: Callable, header: list, page_size: int = 50, prefetch: bool = True, **kwargs):
+		"""
+		Paginated mode: the table shows one page of the rows of a data source (for instance a database query)
+		instead of holding all rows. Page controls are shown above the title row, a click on a column title
+		lets the data source sort on that column.
+
+		:param source:		callable(offset, limit, sort_column, descending) returning (rows, total_count).
+							rows is a list[list] with at most limit datarows (no title row) starting at row offset
+							of the sorted data, sort_column is the title of the column to sort on or None.
+		:param header:		list with the column titles
+		:param page_size:	The number of datarows on a page
+		:param prefetch:	Fetch the next page in a background thread while the current page is shown.
+							The source must then be callable from another thread (a SQLite source for instance
+							has to open its own connection).
+		:keyword:			Other keywords are passed to set_data (editable, toggle, buttons, tip_type, tt_style,
+							lazy_tooltips)
+
+		Examples:
+			| def source(offset, limit, sort_column, descending):
+			|	order = f'ORDER BY "{sort_column}" {"DESC" if descending else "ASC"}' if sort_column else ''
+			|	with sqlite3.connect('data.db') as conn:
+			|		rows = conn.execute(f'SELECT * FROM log {order} LIMIT ? OFFSET ?', (limit, offset)).fetchall()
+			|		total = conn.execute('SELECT COUNT(*) FROM log').fetchone()[0]
+			|	return [list(row) for row in rows], total
+			|
+			| test.set_source(source, ['time', 'level', 'message'], page_size=25)
+		"""
+		self._source = source
+		self._source_header = list(header)
+		self._source_options = kwargs
+		self.page_size = page_size
+		self.prefetch = prefetch
+		self._page_cache = {}
+		self.total_rows = 0
+		self._sort_keys = []
+		self._reverse_sort = [True for x in header]
+		# force a full load of the first page
+		self.row_count = 0
+		self.show_page(0)
+	
+	def show_page(self, page: int):
+		"""
+		(paginated mode) Fetches a page from the data source and shows it
+		:param page: The page number, 0 is the first page. Out of range numbers show the first or last page
+		"""
+		if self._source is None: return
+		if self.total_rows: page = min(page, (self.total_rows - 1) // self.page_size)
+		page = max(0, page)
+		rows, total = self._fetch(page)
+		self.page = page
+		self.total_rows = total
+		
+		table_data = [list(self._source_header)] + [list(row) for row in rows]
+		if len(table_data) == self.row_count:
+			# same number of rows, only the changed cells are pushed to the browser
+			self.set_data(table_data, update_only=True)
+		else:
+			# a full load resets the sort, but the sort of the data source still applies
+			sort_keys, reverse_sort = self._sort_keys, self._reverse_sort
+			self.set_data(table_data, copy_data=False, **self._source_options)
+			self._sort_keys, self._reverse_sort = sort_keys, reverse_sort
+			if self._sort_keys: self._mark_sort_titles()
+		self._update_pager()
+		
+		if self.prefetch and (page + 1) * self.page_size < total: self._prefetch_page(page + 1)
+	
+	def _source_sort(self) -> tuple:
+		""" (paginated mode) The sort for the data source: (column title, descending), or (None, False)"""
+		if not self._sort_keys: return (None, False)
+		column, descending = self._sort_keys[0]
+		return (self._source_header[column], descending)
+	
+	def _fetch(self, page: int) -> tuple:
+		""" (paginated mode) Returns (rows, total_count) for a page, from the prefetched pages when possible"""
+		key = (page,) + self._source_sort()
+		thread = self._prefetch_threads.pop(key, None)
+		# a prefetch that is already running is the fastest way to the page
+		if thread is not None: thread.join()
+		result = self._page_cache.pop(key, None)
+		# prefetched pages are only used once, the data may change. A new dict keeps late prefetches out
+		self._page_cache = {}
+		if result is not None: return result
+		return self._source(page * self.page_size, self.page_size, *self._source_sort())
+	
+	def _prefetch_page(self, page: int):
+		""" (paginated mode) Fetches a page in a background thread"""
+		key = (page,) + self._source_sort()
+		if key in self._prefetch_threads or key in self._page_cache: return
+		page_cache = self._page_cache
 		
-		for i in range(self.row_count):
-			if str(i) in self.children:
-				tr = self.get_child(str(i))
+		def fetch():
+			try:
+				page_cache[key] = self._source(page * self.page_size, self.page_size, *key[1:])
+			except Exception:
+				# the page is fetched again when it is needed, errors then show up in the normal way
+				pass
+		
+		thread = threading.Thread(target=fetch, daemon=True)
+		self._prefetch_threads = {key: thread}
+		thread.start()
+	
+	def _update_pager(self):
+		""" (paginated mode) Creates or updates the page controls, a caption above the title row"""
+		if '_pager' not in self.children:
+			pager = gui.Widget(_type='caption', _class='pager')
+			for key, symbol in [('first', '\u00ab'), ('previous', '\u2039'), ('info', ''), ('next', '\u203a'), ('last', '\u00bb')]:
+				if key == 'info':
+					pager.add_child(key, gui.Label(''))
+					continue
+				btn = gui.Button(symbol)
+				btn.onclick.connect(self._on_page_button, key)
+				pager.add_child(key, btn)
+			self.add_child('_pager', pager)
+			# the caption must be the first child of a table
+			self._render_children_list.remove('_pager')
+			self._render_children_list.insert(0, '_pager')
+		
+		first_row = self.page * self.page_size + 1 if self.total_rows else 0
+		last_row = self.page * self.page_size + self.row_count - 1
+		self.get_child('_pager').get_child('info').set_text(f'{first_row}-{last_row} of {self.total_rows}')
+	
+	def _on_page_button(self, btn, target: str):
+		""" (paginated mode) Handles the page control buttons"""
+		last_page = max(0, (self.total_rows - 1) // self.page_size)
+		page = {'first': 0, 'previous': self.page - 1, 'next': self.page + 1, 'last': last_page}[target]
+		if page != self.page: self.show_page(page)
+	
+	def append_row(self, values: list, tooltips: list = None, rowdata_link=None):
+		"""
+		Adds a datarow after the last datarow (in the original sequence). Only a TableRow for the new row is created,
+		the existing rows are left alone. When the table is sorted the new row shows up at its sorted position.
+		With max_rows set the oldest (first) datarow is dropped when the table gets too long.
+
+		:param values:			list with a value for every column
+		:param tooltips:		list with the tooltips for the new row, redimensioned to the column count
+		:param rowdata_link:	Key or link to the datastructure represented by the new row
+		:raises ValueError:		When the number of values does not match the column count of the table
+		"""
+		self._insert_row(self.row_count, values, tooltips, rowdata_link)
+		while self.max_rows and self.row_count - 1 > self.max_rows: self._remove_row(1)
+	
+	def prepend_row(self, values: list, tooltips: list = None, rowdata_link=None):
+		"""
+		Adds a datarow before the first datarow (in the original sequence), see append_row.
+		With max_rows set the oldest (last) datarow is dropped when the table gets too long.
+		"""
+		self._insert_row(1, values, tooltips, rowdata_link)
+		while self.max_rows and self.row_count - 1 > self.max_rows: self._remove_row(self.row_count - 1)
+	
+	def remove_row(self, row: int):
+		"""
+		Removes a datarow, only its TableRow is removed from the table
+		:param row: The row number as shown in the table, 1 is the first datarow
+		"""
+		if not 0 < row < self.row_count: raise IndexError(f'There is no datarow {row} in the table...')
+		self._remove_row(self.table_data[row][-1])
+	
+	def _insert_row(self, position: int, values: list, tooltips: list, rowdata_link):
+		"""
+		Inserts a datarow in the original sequence and shows it at its place in the (sorted) table
+		:param position: The position in the original sequence (the index of the new row), 1 is the first datarow
+		"""
+		if len(values) != self.column_count or not self.column_count:
+			raise ValueError('The new row must have a value for every column of the table...')
+		tooltips = self._re_dim([tooltips if tooltips is not None else []], 1, self.column_count)[0]
+		
+		# the lists with the tooltips and rowdata_links are kept in the original sequence as well
+		self.rowdata_links.insert(position, rowdata_link)
+		if self.tooltips is None and any(tooltips):
+			self.tooltips = self._store.tooltips = self._re_dim([[]], self.row_count, self.column_count)
+		if self.tooltips is not None: self.tooltips.insert(position, tooltips)
+		
+		if self.columnar:
+			self._store.insert(position, values)
+			row = ColumnarTableRow(self._store, position)
+		else:
+			row = list(values) + tooltips + [rowdata_link] + [position]
+		# the index of a row is its position in the original sequence
+		for later in self._base_rows[position - 1:]: later[-1] += 1
+		self._base_rows.insert(position - 1, row)
+		self.row_count += 1
+		self._sorter.clear()
+		
+		display_row = self._sorted_position(row) if self._sort_keys else position
+		self.table_data.insert(display_row, row)
+		if self.virtual_rows:
+			self._build_table()
+		else:
+			self._insert_row_widget(display_row)
+	
+	def _remove_row(self, position: int):
+		"""
+		Removes a datarow from the original sequence and its TableRow from the table
+		:param position: The position in the original sequence (the index of the row), 1 is the first datarow
+		"""
+		row = self._base_rows[position - 1]
+		display_row = self._sorted_position(row) if self._sort_keys else position
+		del self.table_data[display_row]
+		del self._base_rows[position - 1]
+		for later in self._base_rows[position - 1:]: later[-1] -= 1
+		
+		del self.rowdata_links[position]
+		if self.tooltips is not None: del self.tooltips[position]
+		if self.columnar: self._store.remove(position)
+		self.row_count -= 1
+		self._sorter.clear()
+		
+		if self.virtual_rows:
+			self._build_table()
+		else:
+			self._remove_row_widget(display_row)
+	
+	def _sorted_position(self, row) -> int:
+		""" Binary search for the place of a datarow in the sorted table_data, O(log n) compares"""
+		low, high = 1, len(self.table_data)
+		while low < high:
+			middle = (low + high) // 2
+			if self._sorts_before(self.table_data[middle], row):
+				low = middle + 1
+			else:
+				high = middle
+		return low
+	
+	def _sorts_before(self, row_a, row_b) -> bool:
+		""" True when row_a comes before row_b in the active sort, in line with the TableSorter"""
+		for column, descending in self._sort_keys:
+			key_a, key_b = TableSorter.sort_key(row_a[column]), TableSorter.sort_key(row_b[column])
+			if key_a == key_b: continue
+			# nulls are always last
+			if key_a is None: return False
+			if key_b is None: return True
+			try:
+				less = key_a < key_b
+			except TypeError:
+				less = str(key_a) < str(key_b)
+			return less != descending
+		# equal values keep their original sequence
+		return row_a[-1] < row_b[-1]
+	
+	def _insert_row_widget(self, row: int):
+		"""
+		Creates the TableRow for a new datarow at row, the TableRows below move one key down. The existing rows
+		keep their cells, so remi only has to send the table with the (cached) rows and the new one.
+		"""
+		last_row = self.row_count - 1
+		for i in range(last_row, row, -1):
+			tr = self.children[str(i - 1)]
+			tr.row_number = i
+			for ti in tr.children.values(): ti.row_number = i
+			dict.__setitem__(self.children, str(i), tr)
+		if str(last_row) not in self._render_children_list: self._render_children_list.append(str(last_row))
+		
+		tr = gui.TableRow()
+		tr.on_row_item_click.connect(self.on_table_row_click)
+		tr._parent = self
+		tr.attributes['data-parent-widget'] = self.identifier
+		# bypass the change notification of the children dict for every row, notify once when done
+		dict.__setitem__(self.children, str(row), tr)
+		self.children.onchange()
+		for c, applied in self._cond_styles.items(): self._cond_styles[c] = np.insert(applied, row - 1, None)
+		self._build_table(changed_cells={row: range(self.column_count)})
+	
+	def _remove_row_widget(self, row: int):
+		""" Removes the TableRow at row, the TableRows below move one key up"""
+		for ti in self.children[str(row)].children.values(): self._item_index.pop(id(ti), None)
+		last_row = self.row_count
+		for i in range(row, last_row):
+			tr = self.children[str(i + 1)]
+			tr.row_number = i
+			for ti in tr.children.values(): ti.row_number = i
+			dict.__setitem__(self.children, str(i), tr)
+		dict.__delitem__(self.children, str(last_row))
+		self._render_children_list.remove(str(last_row))
+		self.children.onchange()
+		for c, applied in self._cond_styles.items(): self._cond_styles[c] = np.delete(applied, row - 1)
+	
+	def _diff_table_data(self, old_data, new_data):
+		"""
+		Compares two table_data structures (same dimensions) position by position.
+		Rows where only the data_link changed are re-linked right away, those changes never reach the browser.
+
+		:param old_data: The table_data as currently shown in the table
+		:param new_data: The new table_data
+		:return: dict with per row number a list of column numbers where the value or the tooltip changed
+		"""
+		changed_cells = {}
+		for i, (old_row, new_row) in enumerate(zip(old_data, new_data)):
+			columns = [c for c in range(self.column_count)
+					   if self._cell_changed(old_row[c], new_row[c])
+					   or self._cell_changed(old_row[self.column_count + c], new_row[self.column_count + c])]
+			if columns: changed_cells[i] = columns
+			
+			if old_row[-2] is not new_row[-2] and self._row_key(i) in self.children:
+				tr = self.get_child(self._row_key(i))
+				tr.data_link = new_row[-2]
+				for ti in tr.children.values(): ti.data_link = new_row[-2]
+		return changed_cells
+	
+	@staticmethod
+	def _cell_changed(old_value, new_value) -> bool:
+		"""
+		Returns True if a cell must be refreshed. A change of type is also a change (True vs 1),
+		NaN values are considered equal to each other.
+		"""
+		if old_value is new_value: return False
+		if type(old_value) is not type(new_value): return True
+		if old_value == new_value: return False
+		# NaN is the only value not equal to itself
+		return not (old_value != old_value and new_value != new_value)
+	
+	def _build_table(self, changed_cells: dict = None):
+		"""
+		Builds the table widgets from the table_data, or refreshes existing widgets
+
+		:param changed_cells: dict with per row number the column numbers to refresh, None (default) refreshes all cells
+		"""
+		if changed_cells is not None:
+			rows = sorted(changed_cells)
+		elif self.virtual_rows:
+			self._fit_window()
+			rows = [0] + list(range(self._window_start + 1, self._window_start + 1 + self._window_size()))
+		else:
+			rows = range(self.row_count)
+		
+		for i in rows:
+			row_key = self._row_key(i)
+			# in virtual mode rows outside the window are not materialized
+			if row_key is None: continue
+			if row_key in self.children:
+				tr = self.get_child(row_key)
 			else:
 				tr = gui.TableRow()
-				self.append(tr, str(i))
+				self.append(tr, row_key)
+				if self.virtual_rows:
+					tr.style['height'] = f'{self.row_height}px'
+					# a slot added to an existing window (the table grew) belongs above the bottom spacer
+					if '_bottom' in self.children:
+						self._render_children_list.remove(row_key)
+						self._render_children_list.insert(self._render_children_list.index('_bottom'), row_key)
 			tr.data_link = self.table_data[i][-2]
+			tr.row_number = i
 			
 			# before we start with the columns in the table, check if there are btn columns defined
 			
-		
-		
-			for c in range(self.column_count):
+			
+			columns = range(self.column_count) if changed_cells is None else changed_cells[i]
+			for c in columns:
 				data = self.table_data[i][c]
 				if str(c) in tr.children:
 					ti = tr.get_child(str(c))
 					ti.set_text(f'{data}')
-					# mark the active sort column with a visible border
-					if self.sort_item is ti: ti.style['border'] = 'solid 3px black'
 				
 				else:
 					if i == 0:
@@ -233,7 +718,7 @@ class EditableTable(gui.Table):
 							ti.append([title, tgl_btn])
 							
 						else:
-							ti = gui.TableTitle(f'{data}')
+							ti = TableSortTitle(f'{data}')
 							
 					else:
 						# Not a title row
@@ -245,7 +730,7 @@ class EditableTable(gui.Table):
 												  style='height:100%;background:grey;color:black;margin: 0px 0px 0px 5px')
 							if self._button_style[c]: cell_btn.set_style(self._button_style[c])
 							# cell_btn = gui.Button(u'\u8635', style='height:100%;background:grey;color:black')
-							cell_btn.onclick.connect(self._button_hndlr[c], self, tr, ti, i, c,)
+							cell_btn.onclick.connect(self._on_cell_button, ti)
 							ti.set_text = cell_txt.set_text
 							ti.get_text = cell_txt.get_text
 							
@@ -255,38 +740,184 @@ class EditableTable(gui.Table):
 
 						elif self._editable_check[c]:
 							ti = TableCheckBox(data) if type(data) is bool else gui.TableEditableItem(f'{data}')
-							ti.onchange.connect(self.on_item_changed, int(i), int(c))
+							ti.onchange.connect(self._on_cell_change)
 						else:
 							ti = gui.TableItem(f'{data}')
 					
 					tr.append(ti, str(c))
+					self._item_index[id(ti)] = (tr, c)
 				
 				# now deal with the data_link, they get sorted with the table_data and must be re-connected
 				ti.data_link = self.table_data[i][-2]
-				ti.column_name = self.initial_list[0][c]
+				ti.column_name = self.table_data[0][c]
 				ti.column_number = c
 				ti.row_number = i
 				
 				# The tooltips need to be connected, they may need to change because of a sort action
 				tt_item_tip = self.table_data[i][self.column_count + c]
-				if tt_item_tip:
+				if tt_item_tip == getattr(ti, 'tooltip', None): continue
+				ti.tooltip = tt_item_tip
+				if self.tip_type.lower() == 'row' and c != 0: continue
+				tip_host = tr if self.tip_type.lower() == 'row' else ti
+				if self.lazy_tooltips:
+					# only the text is stored, the shared tooltip element of the table shows it on hover
+					if tt_item_tip:
+						tip_host.attributes['data-tip'] = html.escape(f'{tt_item_tip}')
+					else:
+						tip_host.attributes.pop('data-tip', None)
+				elif not tt_item_tip:
 					if '_tt' in ti.children: ti.remove_child(ti.get_child('_tt'))
+				elif '_tt' in ti.children:
+					# re-use the tooltip widget, only its content changes
+					ti.get_child('_tt').add_child('tip', tt_item_tip)
+				else:
 					tt = gui.Widget(_type='div', _class='tiptext', style=self.tt_style)
-					tt.add_child(str(id(tt_item_tip)), tt_item_tip)
-					if self.tip_type.lower() == 'row' and c == 0:
-						tr.add_class('hooverhere')
-						ti.append(tt, key='_tt')
-					elif self.tip_type.lower() == 'item':
-						ti.add_class('hooverhere')
-						ti.append(tt, key='_tt')
+					tt.add_child('tip', tt_item_tip)
+					tip_host.add_class('hooverhere')
+					ti.append(tt, key='_tt')
+		
+		if self.virtual_rows: self._update_spacers()
+		if self._cond_formatters:
+			self._apply_cond_formats(None if changed_cells is None else {c for cs in changed_cells.values() for c in cs})
+	
+	def _apply_cond_formats(self, columns=None):
+		"""
+		Evaluates the conditional formats of a column for all datarows at once (Conditional_Format_MixIn.evaluate_array)
+		and sets the style of the cells that get another style value than they have now. Other cells are not touched.
+		:param columns: The column numbers to check, None (default) checks all columns with conditional formats
+		"""
+		columns = self._cond_formatters if columns is None else [c for c in columns if c in self._cond_formatters]
+		for c in columns:
+			formatter = self._cond_formatters[c]
+			# evaluated in the original sequence, straight on the NumPy column in columnar mode
+			styles = formatter.evaluate_array(self._column_values(c))
+			if self._sort_keys:
+				styles = styles[np.fromiter((row[-1] for row in self.table_data[1:]), dtype=np.intp,
+											count=self.row_count - 1) - 1]
+			if self.virtual_rows:
+				styles = styles[self._window_start:self._window_start + self._window_size()]
+			
+			applied = self._cond_styles.get(c, np.full(0, None, dtype=object))[:len(styles)]
+			if len(applied) < len(styles):
+				# new TableRows (at the end) have no style yet
+				applied = np.concatenate([applied, np.full(len(styles) - len(applied), None, dtype=object)])
+			for x in np.flatnonzero(styles != applied):
+				ti = self.children[str(x + 1)].children[str(c)]
+				if styles[x] is None:
+					ti.style.pop(formatter.property)
+				else:
+					ti.style[formatter.property] = styles[x]
+			self._cond_styles[c] = styles
+	
+	def _set_tooltip_events(self):
+		"""
+		(lazy_tooltips) One mouseover handler for the whole table moves a single tooltip element into the hovered cell
+		(for row tooltips the first cell of the row) and fills it with the stored tooltip. This is done in the browser
+		only, the tooltip element is created there when it does not exist (anymore) so table updates can not harm it.
+		"""
+		if not self.lazy_tooltips:
+			for attribute in ['onmouseover', 'onmouseleave', 'data-tip-style']: self.attributes.pop(attribute, None)
+			return
+		self.attributes['data-tip-style'] = html.escape(self.tt_style)
+		self.attributes['onmouseover'] = (
+			"var tip=document.getElementById(this.id+'_tip');"
+			"if(!tip){tip=document.createElement('div');tip.id=this.id+'_tip';tip.className='tiptext';}"
+			"tip.style.cssText=this.getAttribute('data-tip-style');"
+			"var cell=event.target.closest('[data-tip]');"
+			"if(!cell||!this.contains(cell)){tip.style.visibility='hidden';return;}"
+			"var host=cell.tagName=='TR'?cell.firstElementChild:cell;"
+			"tip.innerHTML=cell.getAttribute('data-tip');if(tip.parentNode!==host){host.appendChild(tip);}"
+			"tip.style.visibility='visible';tip.style.whiteSpace='pre';")
+		self.attributes['onmouseleave'] = (
+			"var tip=document.getElementById(this.id+'_tip');if(tip){tip.style.visibility='hidden';}")
+	
+	def _window_size(self) -> int:
+		""" (virtual mode) Returns the number of materialized datarows, visible rows plus overscan on both sides"""
+		return min(self.virtual_rows + 2 * self.overscan, self.row_count - 1)
+	
+	def _fit_window(self):
+		""" (virtual mode) Keeps the window inside the table_data when rows were removed, surplus slots are removed"""
+		self._window_start = max(0, min(self._window_start, self.row_count - 1 - self._window_size()))
+		for slot in range(self._window_size() + 1, self.virtual_rows + 2 * self.overscan + 1):
+			if str(slot) not in self.children: continue
+			tr = self.get_child(str(slot))
+			for ti in tr.children.values(): self._item_index.pop(id(ti), None)
+			self.remove_child(tr)
+	
+	def _row_key(self, row):
+		"""
+		Returns the children key of the TableRow that shows the row (in table_data sequence).
+		In virtual mode the TableRows are slots in a sliding window, rows outside the window return None
+		"""
+		if not self.virtual_rows or row == 0: return str(row)
+		slot = row - self._window_start
+		return str(slot) if 0 < slot <= self._window_size() else None
+	
+	def _update_spacers(self):
+		"""
+		(virtual mode) Empty rows above and below the window get the height of the rows not materialized,
+		so the scrollbar of the table represents the complete table_data
+		"""
+		for key, height, position in [('_top', self._window_start, 1),
+									  ('_bottom', self.row_count - 1 - self._window_start - self._window_size(), None)]:
+			if key not in self.children:
+				spacer = gui.TableRow()
+				filler = gui.TableItem('')
+				filler.attributes['colspan'] = str(max(self.column_count, 1))
+				spacer.append(filler)
+				# no append, the spacers should not respond to clicks
+				self.add_child(key, spacer)
+				self._render_children_list.remove(key)
+				if position is None:
+					self._render_children_list.append(key)
+				else:
+					self._render_children_list.insert(position, key)
+			self.get_child(key).style['height'] = f'{max(height, 0) * self.row_height}px'
+	
+	def _move_window(self, window_start: int):
+		"""
+		(virtual mode) Slides the window of materialized rows, the existing TableRows are re-used for the new rows.
+		:param window_start: Number of datarows before the first materialized row
+		"""
+		window_start = max(0, min(window_start, self.row_count - 1 - self._window_size()))
+		if window_start == self._window_start: return
+		self._window_start = window_start
+		self._build_table()
+	
+	@decorate_set_on_listener("(self, emitter, first_row)")
+	@decorate_event_js("var el=this;clearTimeout(el.scroll_timer);el.scroll_timer=setTimeout(function(){"
+					   "remi.sendCallbackParam('%(emitter_identifier)s','%(event_name)s',{'scroll_top':el.scrollTop});},50);")
+	def on_scroll(self, scroll_top):
+		"""
+		(virtual mode) Event for scrolling the table, slides the window of materialized rows when needed
+		:param scroll_top: The scroll position of the table in pixels (as send by the browser)
+		:return: first_row, the first visible datarow
+		"""
+		first_row = int(float(scroll_top)) // self.row_height + 1
+		if not self._window_start < first_row <= self._window_start + self._window_size() - self.virtual_rows + 1:
+			self._move_window(first_row - 1 - self.overscan)
+		return (first_row,)
+	
+	def _on_cell_change(self, ti, new_value):
+		""" Passes the onchange of an editable cell to on_item_changed with the current coordinates of the cell"""
+		row, column = self.item_coords(ti)
+		self.on_item_changed(ti, new_value, row, column)
+	
+	def _on_cell_button(self, btn, ti):
+		""" Calls the button handler of a button column with the current coordinates of the cell"""
+		row, column = self.item_coords(ti)
+		self._button_hndlr[column](btn, self, ti.get_parent(), ti, row, column)
 	
 	def reset(self):
 		"""
 		Resets all values in the table to their initial values. Also resets sorting
 		"""
-		if self.initial_list:
-			self.set_data(self.initial_list, self.tooltips, editable=self.editable,
-						  tip_type=self.tip_type, tt_style=self.tt_style)
+		if type(self.initial_list) is pd.DataFrame or self.initial_list:
+			# the snapshot is private already, so it can be shared with the table
+			self.set_data(self.initial_list, self._initial_tooltips, editable=self.editable, toggle=self.toggle,
+						  buttons=self.buttons, tip_type=self.tip_type, tt_style=self.tt_style,
+						  lazy_tooltips=self.lazy_tooltips, cond_formats=self.cond_formats,
+						  rowdata_links=self._initial_rowdata_links, copy_data=False)
 	
 	def item_at(self, row, column):
 		"""Returns the TableItem instance at row, column coordinates
@@ -296,11 +927,17 @@ class EditableTable(gui.Table):
 			column (int|str): zero based index or column title name
 		"""
 		if type(column) is str and not column.isnumeric():
-			return self.children[str(row)].children[str(self.column_nr(column))]
-		else:
-			return self.children[str(row)].children[str(column)]
+			column = self.column_nr(column)
+		row_key = self._row_key(int(row))
+		# in virtual mode the row may be outside the window of materialized rows
+		if row_key is None: return None
+		return self.children[row_key].children[str(column)]
 	
 	def value_at(self, row, column):
+		if self.virtual_rows:
+			# in virtual mode not every row is materialized, so use the table_data
+			if type(column) is str and not column.isnumeric(): column = self.column_nr(column)
+			return f'{self.table_data[int(row)][int(column)]}'
 		return self.item_at(row, column).get_text()
 	
 	def item_coords(self, table_item):
@@ -310,20 +947,16 @@ class EditableTable(gui.Table):
 		Args:
 			table_item (TableItem): an item instance
 		"""
-		for row_key in self.children.keys():
-			for item_key in self.children[row_key].children.keys():
-				if self.children[row_key].children[item_key] == table_item:
-					return (int(row_key), int(item_key))
-		return None
+		if id(table_item) not in self._item_index: return None
+		# the TableRow knows its current row number, also after a sort or a move of the virtual window
+		tr, column = self._item_index[id(table_item)]
+		return (tr.row_number, column)
 	
 	def column_name(self, column_nr):
 		return self.item_at(0, column_nr).get_text()
 	
 	def column_nr(self, column_name):
-		for col_nr in range(self.column_count):
-			if self.column_name(col_nr) == column_name:
-				return col_nr
-		return None
+		return self._column_index.get(str(column_name), None)
 	
 	def _re_dim(self, input_list, row_count, column_count):
 		"""
@@ -341,6 +974,68 @@ class EditableTable(gui.Table):
 			nw_list[teller] = nw_list[teller][:column_count] + [None] * (column_count - len(nw_list[teller]))
 		return nw_list
 	
+	def _column_values(self, column: int):
+		""" Returns the values of a column in the original row sequence, a list or (columnar mode) a NumPy array"""
+		if self.columnar: return self._store.columns[column]
+		return [row[column] for row in self._base_rows]
+	
+	def _apply_sort(self):
+		""" Puts the datarows of the table_data in the sequence of the active sort (_sort_keys)"""
+		permutation = self._sorter.permutation(self._sort_keys, self._column_values)
+		self.table_data = [self.table_data[0]] + [self._base_rows[x] for x in permutation]
+	
+	def _update_sort_keys(self, column: int, add_key: bool = False):
+		"""
+		Changes the active sort after a click on a column title.
+		:param column: 	The column number of the clicked title
+		:param add_key: (shift-click) Add the column as next sort key, or flip its direction when it already is a key.
+						Otherwise the column becomes the only sort key, with the direction flipped on every click
+		"""
+		if add_key and self._sort_keys:
+			for nr, (key_column, descending) in enumerate(self._sort_keys):
+				if key_column == column:
+					self._sort_keys[nr] = (column, not descending)
+					break
+			else:
+				self._sort_keys.append((column, False))
+			self._reverse_sort[column] = dict(self._sort_keys)[column]
+		else:
+			self._reverse_sort[column] = not self._reverse_sort[column]
+			self._sort_keys = [(column, self._reverse_sort[column])]
+		
+		self._mark_sort_titles()
+	
+	def _mark_sort_titles(self):
+		""" Gives the active sort item a clearly visible border, secondary sort keys a dashed border"""
+		sort_columns = [key_column for key_column, descending in self._sort_keys]
+		for c in range(self.column_count):
+			ti = self.item_at(0, c)
+			if c not in sort_columns:
+				ti.style['border'] = ''
+			else:
+				ti.style['border'] = 'solid 3px black' if c == sort_columns[0] else 'dashed 3px black'
+		self.sort_item = self.item_at(0, sort_columns[0])
+	
+	def _reorder_rows(self, old_table_data: list):
+		"""
+		Moves the existing TableRows into the sequence of the (re-sorted) table_data. The cells keep their content,
+		so the browser receives the table once with rows in a new order instead of an update for every cell.
+		:param old_table_data: The table_data in the sequence the TableRows currently have
+		"""
+		row_widgets = {old_table_data[i][-1]: self.children[str(i)] for i in range(1, self.row_count)}
+		if self._cond_styles:
+			# the cells keep their conditional style as well, it moves with the TableRows
+			old_rows = {old_table_data[i][-1]: i - 1 for i in range(1, self.row_count)}
+			moved = np.fromiter((old_rows[row[-1]] for row in self.table_data[1:]), dtype=np.intp, count=self.row_count - 1)
+			for c, applied in self._cond_styles.items(): self._cond_styles[c] = applied[moved]
+		for i in range(1, self.row_count):
+			tr = row_widgets[self.table_data[i][-1]]
+			tr.row_number = i
+			for ti in tr.children.values(): ti.row_number = i
+			# bypass the change notification of the children dict for every row, notify once when done
+			dict.__setitem__(self.children, str(i), tr)
+		self.children.onchange()
+	
 	@decorate_event
 	def on_item_changed(self, item, new_value, row, column):
 		"""Event for the item change.
@@ -352,14 +1047,98 @@ class EditableTable(gui.Table):
 			row (int): 				row index.
 			column (int): 			column index.
 		"""
-		casting_type = type(self.table_data[row][column])
+		old_value = self.table_data[row][column]
+		casting_type = type(old_value)
 		# if self.table_df is not None:
 		# 	# casting_type = type(self.table_df.iat[row - 1, column])
 		# 	self.table_df.iat[row - 1, column] = casting_type(new_value)
 		self.table_data[row][column] = casting_type(new_value)
+		self._sorter.clear(column)
+		self._track_change(self.table_data[row], column, old_value, self.table_data[row][column])
+		if column in self._cond_formatters: self._apply_cond_formats([column])
 		
 		return (item, new_value, row, column)
 	
+	def _track_change(self, data_row, column: int, old_value, new_value):
+		""" Registers an edit in the dirty cells and (batch_window) in the current batch, restarting the window"""
+		self._track_changes([(data_row, column, old_value, new_value)])
+	
+	def _track_changes(self, edits):
+		""" Registers (datarow, column number, old value, new value) edits, see _track_change"""
+		with self._batch_lock:
+			for changes in [self._changes, self._batch] if self.batch_window else [self._changes]:
+				for data_row, column, old_value, new_value in edits:
+					key = (id(data_row), column)
+					change = changes.setdefault(key, [data_row, column, old_value, new_value])
+					change[3] = new_value
+					# a cell that got its original value back is not dirty anymore
+					if not self._cell_changed(change[2], change[3]): del changes[key]
+			if self.batch_window:
+				if self._batch_timer is not None: self._batch_timer.cancel()
+				self._batch_timer = threading.Timer(self.batch_window, self.flush_changes)
+				self._batch_timer.daemon = True
+				self._batch_timer.start()
+	
+	def _carry_changes(self, old_base_rows: list):
+		"""
+		(update_only) An edit survives a refresh when the refreshed row is the same record (same position and
+		rowdata_link) and the refresh still brings the edited value, it moves to the new datarow. Other edits of
+		the refreshed rows are dropped, the user does not see them anymore.
+		In paginated mode the changes are not carried, they stay with the datarows of the page they were made on.
+		"""
+		old_positions = {id(row): x for x, row in enumerate(old_base_rows)}
+		with self._batch_lock:
+			changes, self._changes = self._changes, {}
+			for key, (data_row, column, old_value, new_value) in changes.items():
+				x = old_positions.get(id(data_row), None)
+				if x is None:
+					# not a row of the refreshed table
+					self._changes[key] = [data_row, column, old_value, new_value]
+					continue
+				if x >= len(self._base_rows): continue
+				row = self._base_rows[x]
+				if row[-2] != data_row[-2] or self._cell_changed(new_value, row[column]): continue
+				self._changes[(id(row), column)] = [row, column, old_value, new_value]
+	
+	def _change_list(self, changes) -> list[tuple]:
+		""" Turns tracked changes into a list of (rowdata_link, column title, original value, new value) tuples"""
+		return [(data_row[-2], self.table_data[0][column], old_value, new_value)
+				for data_row, column, old_value, new_value in changes]
+	
+	def get_changes(self, clear: bool = False) -> list[tuple]:
+		"""
+		Returns the edits since the data was loaded (or since the last clear), one entry per dirty cell with the
+		value it had when loaded and its current value. Editing a cell back to its original value makes it clean again.
+
+		:param clear:	Forget the changes after returning them, for instance after they were committed to a database
+		:return:		list of (rowdata_link, column title, original value, new value) tuples
+		"""
+		with self._batch_lock:
+			result = self._change_list(self._changes.values())
+			if clear: self._changes = {}
+		return result
+	
+	def flush_changes(self):
+		"""
+		(batch_window) Ends the current batch window now, its edits are passed to the on_items_changed event.
+		Called by a timer when the batch window expires.
+		"""
+		with self._batch_lock:
+			if self._batch_timer is not None: self._batch_timer.cancel()
+			batch, self._batch, self._batch_timer = self._batch, {}, None
+			changes = self._change_list(batch.values())
+		if changes: self.on_items_changed(changes)
+	
+	@decorate_event
+	def on_items_changed(self, changes):
+		"""
+		Event with the edits collected in a batch window (see batch_window), so a whole edit session can be handled
+		at once. Usually called from the timer thread, use the update_lock of the App when the handler changes widgets.
+
+		:param changes: list of (rowdata_link, column title, value before the batch, new value) tuples
+		"""
+		return (changes,)
+	
 	@decorate_event
 	def on_table_row_click(self, table_row, table_item):
 		""" Event for the table row clicked
@@ -375,18 +1154,20 @@ class EditableTable(gui.Table):
 		if not self.sort_on_title_click: return
 		
 		row, col = table_item.row_number, table_item.column_number
-		if row == 0:
-			# sort the content, keep the header
-			# Give the active sort item a clearly visible border
-			if self.sort_item: self.sort_item.style['border'] = ''
-			self._reverse_sort[col] = not self._reverse_sort[col]
-			sorted_data = sorted(self.table_data[1:], key=lambda x: x[col], reverse=self._reverse_sort[col])
-			sorted_data = [self.table_data[0]] + sorted_data
-			self.table_data = sorted_data
-			self.sort_item = table_item
-			self.sort_item.style['border'] = 'solid 3px black'
-			# self.empty()
-			self._build_table()
+		if row == 0 and self._source is not None:
+			# paginated mode, the data source sorts (on one column) and the table starts at the first page again
+			self._update_sort_keys(col)
+			self.show_page(0)
+		elif row == 0:
+			# sort the content, keep the header. A shift-click adds a secondary sort key
+			self._update_sort_keys(col, add_key=getattr(table_item, 'shift_key', False))
+			old_table_data = self.table_data
+			self._apply_sort()
+			if self.virtual_rows:
+				# the window rows show other datarows now
+				self._build_table()
+			else:
+				self._reorder_rows(old_table_data)
 		return (table_row, table_item)
 	
 	@decorate_event
@@ -399,10 +1180,350 @@ class EditableTable(gui.Table):
 		if not row == 0: return
 		self.toggle_in_progress = True
 		
-		tmp_df = self.get_data(as_dataframe=True)
-		tmp_df.iloc[:, column] = ~ tmp_df.iloc[:, column]
-		self.set_data(tmp_df, update_only=True)
+		# flip the values in place, the order of the rows does not change so there is no need to sort or rebuild
+		old_values = self._column_values(column)
+		if self.columnar:
+			# the store replaces the column, the old array keeps the old values
+			old_values = old_values.tolist()
+			self._store.toggle(column)
+		else:
+			for data_row in self._base_rows: data_row[column] = not data_row[column]
+		# every flipped cell is an edit, just like an edit through on_item_changed
+		self._track_changes([(data_row, column, old_value, data_row[column])
+							 for data_row, old_value in zip(self._base_rows, old_values)])
+		self._sorter.clear(column)
+		self._refresh_column(column)
 		return (row, column)
+	
+	def _refresh_column(self, column: int):
+		""" Refreshes the cells of one column, remi is notified once for the table instead of once for every cell"""
+		self.disable_refresh()
+		try:
+			self._build_table(changed_cells={i: [column] for i in range(1, self.row_count)})
+		finally:
+			self.enable_refresh()
+		self._need_update()
+
+
+class TableSorter(object):
+	"""
+	Sort engine for the EditableTable. Computes the permutation of the datarows (in their original sequence)
+	for one or more sort keys. Per column the ascending sequence and the rank of every value is calculated once
+	and cached, None and NaN values are always placed last, equal values keep their original sequence.
+	Sorting the same column the other way around reuses the cached sequence in O(n).
+	"""
+	
+	def __init__(self):
+		self._columns = {}
+		""" per column number: (ascending sequence with the nulls last, rank per row, number of nulls)"""
+		self._permutations = {}
+		""" per tuple of sort keys the resulting permutation"""
+	
+	def clear(self, column: int = None):
+		"""
+		Forgets cached results, to be called when the data changes
+		:param column: Only forget the results involving this column, None (default) forgets everything
+		"""
+		if column is None:
+			self._columns.clear()
+			self._permutations.clear()
+			return
+		self._columns.pop(column, None)
+		for sort_keys in [x for x in self._permutations if column in dict(x)]: self._permutations.pop(sort_keys)
+	
+	def permutation(self, sort_keys: list, column_values) -> np.ndarray:
+		"""
+		Returns the sequence of the datarows for the sort keys
+		:param sort_keys: 		list of (column number, descending) tuples, the first one is the primary sort key
+		:param column_values: 	function returning the values of a column (in the original row sequence)
+		:return: array with the original row positions in sorted sequence
+		"""
+		sort_keys = tuple(sort_keys)
+		if sort_keys in self._permutations: return self._permutations[sort_keys]
+		
+		for column, descending in sort_keys:
+			if column not in self._columns: self._columns[column] = self._analyse(column_values(column))
+		
+		if len(sort_keys) == 1:
+			column, descending = sort_keys[0]
+			sequence, ranks, null_count = self._columns[column]
+			result = self._reverse(sequence, ranks, null_count) if descending else sequence
+		else:
+			# lexsort uses the last key as primary key
+			result = np.lexsort([self._sort_ranks(column, descending) for column, descending in reversed(sort_keys)])
+		self._permutations[sort_keys] = result
+		return result
+	
+	def _sort_ranks(self, column: int, descending: bool) -> np.ndarray:
+		""" Ranks of a column for a (multi column) lexsort, with the nulls last in both directions"""
+		sequence, ranks, null_count = self._columns[column]
+		if not descending: return ranks
+		# the nulls have the highest rank, just above the ranks of the distinct values
+		distinct = ranks.max(initial=-1) + 1 - (1 if null_count else 0)
+		return np.where(ranks < distinct, distinct - 1 - ranks, ranks)
+	
+	@staticmethod
+	def _reverse(sequence: np.ndarray, ranks: np.ndarray, null_count: int) -> np.ndarray:
+		"""
+		Turns an ascending sequence into a descending one in O(n): the runs of equal values are placed in reversed
+		order, within a run the rows keep their original sequence. The nulls stay at the end.
+		"""
+		count = len(sequence) - null_count
+		values = sequence[:count]
+		sorted_ranks = ranks[values]
+		starts = np.flatnonzero(np.r_[True, sorted_ranks[1:] != sorted_ranks[:-1]]) if count else np.zeros(0, dtype=np.intp)
+		lengths = np.diff(np.r_[starts, count])
+		run_start = np.repeat(starts, lengths)
+		run_length = np.repeat(lengths, lengths)
+		result = np.empty_like(values)
+		result[count - 2 * run_start - run_length + np.arange(count)] = values
+		return np.concatenate([result, sequence[count:]])
+	
+	@staticmethod
+	def sort_key(value):
+		"""
+		Returns the key a single value is sorted on: None for nulls, numbers compare as floats and other values are
+		grouped per type. Used to find the place of a new row in a sorted table.
+		"""
+		if pd.api.types.is_scalar(value) and pd.isna(value): return None
+		if isinstance(value, (bool, int, float, np.number)): return ('', float(value))
+		return (type(value).__name__, value)
+	
+	@staticmethod
+	def _analyse(values) -> tuple:
+		"""
+		Sorts the values of one column
+		:return: (the ascending sequence with the nulls last, the rank of every row (nulls rank last), number of nulls)
+		"""
+		if not isinstance(values, np.ndarray):
+			column = np.empty(len(values), dtype=object)
+			column[:] = values
+			values = column
+		count = len(values)
+		
+		nulls = pd.isna(values) if values.dtype.kind in 'OfmM' else np.zeros(count, dtype=bool)
+		non_nulls = np.flatnonzero(~nulls)
+		keys = values[non_nulls]
+		types = set(map(type, keys)) if keys.dtype.kind == 'O' else set()
+		if types and all(issubclass(x, (bool, int, float, np.number)) for x in types): keys = keys.astype(float)
+		
+		if keys.dtype.kind != 'O':
+			order = np.argsort(keys, kind='stable')
+			sorted_keys = keys[order]
+			changes = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]] if len(keys) else np.zeros(0, dtype=bool)
+		else:
+			# Python objects, values of different types are grouped per type
+			if len(types) > 1: keys = [TableSorter.sort_key(x) for x in keys]
+			try:
+				order = sorted(range(len(keys)), key=keys.__getitem__)
+			except TypeError:
+				keys = [(type(x).__name__, str(x)) for x in values[non_nulls]]
+				order = sorted(range(len(keys)), key=keys.__getitem__)
+			sorted_keys = [keys[x] for x in order]
+			changes = [True] * bool(order) + [a != b for a, b in zip(sorted_keys[1:], sorted_keys[:-1])]
+			order = np.asarray(order, dtype=np.intp)
+		
+		sequence = np.concatenate([non_nulls[order], np.flatnonzero(nulls)]).astype(np.intp)
+		ranks = np.empty(count, dtype=np.intp)
+		ranks[non_nulls[order]] = np.cumsum(changes) - 1
+		ranks[nulls] = (ranks[non_nulls].max(initial=-1) + 1)
+		return sequence, ranks, count - len(non_nulls)
+
+
+class TableSortTitle(gui.TableTitle):
+	"""
+	Title cell of the EditableTable, the click event also tells if the shift key was pressed (shift_key attribute)
+	"""
+	
+	def __init__(self, text='', *args, **kwargs):
+		super(TableSortTitle, self).__init__(text, *args, **kwargs)
+		self.shift_key = False
+	
+	@decorate_set_on_listener("(self, emitter)")
+	@decorate_event_js("remi.sendCallbackParam('%(emitter_identifier)s','%(event_name)s',{'shift_key':event.shiftKey});"
+					   "event.stopPropagation();event.preventDefault();")
+	def onclick(self, shift_key=False):
+		self.shift_key = str(shift_key).lower() == 'true'
+		return ()
+
+
+class ColumnarTableData(object):
+	"""
+	Columnar backing store for the EditableTable. Every column is kept as a NumPy array (numeric and boolean
+	columns in their native dtype, all others as object arrays) in the original row sequence.
+	The datarows in the table_data of the table are ColumnarTableRow views on this store, so sorting only
+	shuffles these views and never copies any values.
+	"""
+	
+	def __init__(self, data: Union[list[list], pd.DataFrame], tooltips: list[list] = None, rowdata_links: list = None):
+		"""
+		:param data: 			list[list] with the title row as first row, or a DataFrame
+		:param tooltips: 		list[list] with the tooltips (title row first) redimensioned to the data, or None
+		:param rowdata_links: 	list with a rowdata_link per row (title row first), or None
+		"""
+		if type(data) is pd.DataFrame:
+			self.header = data.columns.tolist()
+			self._buffers = [self._to_column(data.iloc[:, c]) for c in range(len(self.header))]
+		else:
+			self.header = list(data[0])
+			self._buffers = [self._list_column([row[c] for row in data[1:]]) for c in range(len(self.header))]
+		self.column_count = len(self.header)
+		self._count = len(self._buffers[0]) if self._buffers else 0
+		# the columns may be (read only) views on the source, they are copied before the first change (copy-on-write)
+		self._shared = set(range(self.column_count))
+		self._views()
+		self.tooltips = tooltips
+		self.rowdata_links = rowdata_links
+		self.rows = [ColumnarTableRow(self, x) for x in range(1, len(self) + 1)]
+	
+	@staticmethod
+	def _to_column(series: pd.Series) -> np.ndarray:
+		""" Numeric and boolean columns keep their dtype, everything else becomes an array of Python objects"""
+		if series.dtype.kind in 'biuf': return series.to_numpy()
+		return series.to_numpy(dtype=object)
+	
+	@staticmethod
+	def _list_column(values: list) -> np.ndarray:
+		"""
+		Columns of only ints, only floats or only bools get their native dtype. All others (None's, mixed types)
+		become an array of the values as they are, so the table shows and returns exactly the values it got.
+		"""
+		types = set(map(type, values))
+		if len(types) == 1 and issubclass(types.pop(), (int, float, bool, np.number, np.bool_)):
+			column = np.array(values)
+			if column.dtype.kind in 'biuf': return column
+		return np.array(values, dtype=object) if values else np.empty(0, dtype=object)
+	
+	@staticmethod
+	def _fits(value, dtype: np.dtype) -> bool:
+		""" True when the value can be stored in an array of the dtype without changing it"""
+		if dtype.kind == 'O': return True
+		if dtype.kind == 'b': return isinstance(value, (bool, np.bool_))
+		if isinstance(value, (bool, np.bool_)): return False
+		if dtype.kind in 'iu': return isinstance(value, (int, np.integer))
+		return dtype.kind == 'f' and isinstance(value, (int, float, np.integer, np.floating))
+	
+	def _views(self):
+		""" The columns are views on the first _count values of the buffers, a buffer may have room for more rows"""
+		self.columns = [buffer[:self._count] for buffer in self._buffers]
+	
+	def _writable(self, column: int) -> np.ndarray:
+		""" Returns the array of a column for changing it, a column shared with the source is copied first"""
+		if column in self._shared:
+			self._buffers[column] = self._buffers[column].copy()
+			self.columns[column] = self._buffers[column][:self._count]
+			self._shared.discard(column)
+		return self.columns[column]
+	
+	def __len__(self):
+		""" The number of datarows (title row excluded)"""
+		return self._count
+	
+	def insert(self, index: int, values: list):
+		"""
+		Inserts a datarow, the rows from index onwards move one position down. The buffers grow with room to spare,
+		so appending a row costs O(columns). A value that does not fit the dtype of its column turns the column
+		into an object column.
+		:param index: 	The position of the new row, 1 is the first datarow and len + 1 appends the row
+		:param values: 	list with a value for every column
+		"""
+		count = self._count
+		for c, value in enumerate(values):
+			buffer = self._buffers[c]
+			fits = self._fits(value, buffer.dtype)
+			if c in self._shared or len(buffer) == count or not fits:
+				new_buffer = np.empty(max(2 * count, 16), dtype=buffer.dtype if fits else object)
+				new_buffer[:count] = buffer[:count]
+				buffer = self._buffers[c] = new_buffer
+			buffer[index:count + 1] = buffer[index - 1:count]
+			buffer[index - 1] = value
+		self._shared.clear()
+		self._count += 1
+		self._views()
+	
+	def remove(self, index: int):
+		""" Removes the datarow at index (1 is the first datarow), the rows below move one position up"""
+		count = self._count
+		for c in range(self.column_count):
+			if c in self._shared: self._buffers[c] = self._buffers[c].copy()
+			buffer = self._buffers[c]
+			buffer[index - 1:count - 1] = buffer[index:count]
+			# do not keep a reference to a removed object
+			if buffer.dtype.kind == 'O': buffer[count - 1] = None
+		self._shared.clear()
+		self._count -= 1
+		self._views()
+	
+	def tooltip(self, index: int, column: int):
+		return self.tooltips[index][column] if self.tooltips is not None else None
+	
+	def rowdata_link(self, index: int):
+		return self.rowdata_links[index] if self.rowdata_links is not None else None
+	
+	def table_data(self) -> list:
+		""" Returns a table_data list, a title row followed by the ColumnarTableRows in the original sequence"""
+		title_row = (self.header + [self.tooltip(0, c) for c in range(self.column_count)] +
+					 [self.rowdata_link(0)] + [0])
+		return [title_row] + list(self.rows)
+	
+	def get_value(self, index: int, column: int):
+		""" Returns the value as a Python object (so bool rather than numpy.bool_), index 1 is the first datarow"""
+		return self.columns[column].item(index - 1)
+	
+	def set_value(self, index: int, column: int, value):
+		self._writable(column)[index - 1] = value
+	
+	def toggle(self, column: int):
+		""" Flips all boolean values in a column"""
+		self._buffers[column] = np.logical_not(self.columns[column].astype(bool))
+		self._shared.discard(column)
+		self._views()
+	
+	def to_dataframe(self) -> pd.DataFrame:
+		result = pd.DataFrame({c: column for c, column in enumerate(self.columns)})
+		result.columns = self.header
+		return result
+	
+	def to_list(self) -> list[list]:
+		return [list(self.header)] + [list(row) for row in zip(*[column.tolist() for column in self.columns])]
+
+
+class ColumnarTableRow(object):
+	"""
+	A datarow of the EditableTable table_data in columnar mode. Looks like the list used in the normal mode
+	(values, tooltips, rowdata_link and index) but reads from and writes to the columns of the ColumnarTableData
+	"""
+	__slots__ = ('store', 'index')
+	
+	def __init__(self, store: ColumnarTableData, index: int):
+		self.store = store
+		self.index = index
+	
+	def __len__(self):
+		return 2 * self.store.column_count + 2
+	
+	def __getitem__(self, item):
+		if type(item) is slice:
+			return [self[x] for x in range(*item.indices(len(self)))]
+		if item < 0: item += len(self)
+		column_count = self.store.column_count
+		if item < column_count: return self.store.get_value(self.index, item)
+		if item < 2 * column_count: return self.store.tooltip(self.index, item - column_count)
+		if item == 2 * column_count: return self.store.rowdata_link(self.index)
+		if item == 2 * column_count + 1: return self.index
+		raise IndexError('ColumnarTableRow index out of range')
+	
+	def __setitem__(self, item, value):
+		if item < 0: item += len(self)
+		if item == 2 * self.store.column_count + 1:
+			# the table renumbers its rows when rows are inserted or removed
+			self.index = value
+			return
+		if not 0 <= item < self.store.column_count: raise IndexError('Only the values of a ColumnarTableRow can be set')
+		self.store.set_value(self.index, item, value)
+	
+	def __repr__(self):
+		return repr(self[:])
 
 
 class TableCheckBox(gui.Container):
@@ -440,32 +1561,135 @@ class TableCheckBox(gui.Container):
 
 
 class Conditional_Format_MixIn():
+	"""
+	Conditional formatting of a style property of a widget, driven by a list of rules (cond_formats). Every rule is a
+	dict with a condition and the style values for a true or false outcome:
+		{'cond': 'gt', 'check_value': 20, 'true': 'red', 'false': 'black', 'qit': True}
+	cond is one of gt/>, gte/>=, st/<, ste/<=, eq/=/==, neq/!=. The rules are checked in sequence, the last style
+	value that applies wins, a true rule with qit (quit) ends the check. A None or NaN value makes every condition false.
+
+	The rules are compiled once into operator callables. A ladder of thresholds (all rules with the same condition,
+	a true style and qit, no false style) is checked with a binary search instead of rule by rule.
+	"""
+	OPERATORS = {'gt': operator.gt, '>': operator.gt, 'gte': operator.ge, '>=': operator.ge,
+				 'st': operator.lt, '<': operator.lt, 'ste': operator.le, '<=': operator.le,
+				 'eq': operator.eq, '=': operator.eq, '==': operator.eq, 'neq': operator.ne, '!=': operator.ne}
+	
 	def __init__(self, widget, property, cond_formats):
 		self.widget = widget
 		self.property = property
 		self.cond_formats = cond_formats
+		self._rules = self.compile(cond_formats)
+		self._ladder = self._compile_ladder(self._rules)
+		self._applied_style = None
+		""" The style value set by the last do_cond_format, the widget is only changed for another value"""
+	
+	@classmethod
+	def compile(cls, cond_formats: list[dict]) -> list[tuple]:
+		"""
+		Turns the rules into (operator, check_value, true style, false style, quit) tuples
+		:raises ValueError: for an unknown condition
+		"""
+		rules = []
+		for cond_format in cond_formats:
+			if cond_format['cond'] not in cls.OPERATORS: raise ValueError(f'Unknown condition {cond_format["cond"]}...')
+			rules.append((cls.OPERATORS[cond_format['cond']], cond_format['check_value'], cond_format.get('true', None),
+						  cond_format.get('false', None), cond_format.get('qit', False)))
+		return rules
+	
+	@staticmethod
+	def _compile_ladder(rules: list[tuple]) -> Union[tuple, None]:
+		"""
+		Checks if the rules are a ladder of thresholds, the first true rule decides the style
+		:return: (operator, sorted thresholds, style of the first true rule per number of true thresholds), or None
+		"""
+		if len(rules) < 2: return None
+		op = rules[0][0]
+		if op not in (operator.gt, operator.ge, operator.lt, operator.le): return None
+		for rule_op, check_value, true_style, false_style, quit in rules:
+			if rule_op is not op or not true_style or false_style or not quit: return None
+			if isinstance(check_value, bool) or not isinstance(check_value, (int, float)): return None
+		order = sorted(range(len(rules)), key=lambda x: rules[x][1])
+		thresholds = [rules[x][1] for x in order]
+		if op in (operator.lt, operator.le):
+			# the true thresholds are the highest ones, count them from the top
+			order.reverse()
+		# the first rule (in sequence) of the true thresholds wins
+		styles, first = [None], None
+		for x in order:
+			first = x if first is None else min(first, x)
+			styles.append(rules[first][2])
+		return op, thresholds, styles
+	
+	def evaluate(self, value):
+		""" Returns the style value for the value, None when no rule gives a style"""
+		# NaN is a null just like None, it makes every condition false (bisect would put it after all thresholds)
+		is_null = value is None or value != value
+		if self._ladder is not None and not is_null:
+			op, thresholds, styles = self._ladder
+			try:
+				if op is operator.gt: count = bisect_left(thresholds, value)
+				elif op is operator.ge: count = bisect_right(thresholds, value)
+				elif op is operator.lt: count = len(thresholds) - bisect_right(thresholds, value)
+				else: count = len(thresholds) - bisect_left(thresholds, value)
+				return styles[count]
+			except TypeError:
+				return None
+		style = None
+		for op, check_value, true_style, false_style, quit in self._rules:
+			try:
+				check = not is_null and op(value, check_value)
+			except TypeError:
+				check = False
+			if check:
+				if true_style: style = true_style
+				if quit: break
+			elif false_style:
+				style = false_style
+		return style
+	
+	def evaluate_array(self, values) -> np.ndarray:
+		"""
+		Vectorized evaluate for a whole column of values
+		:param values: list or NumPy array with the values
+		:return: object array with per value the style value, or None
+		"""
+		if not isinstance(values, np.ndarray):
+			converted = np.asarray(values)
+			# NumPy turns mixed values into strings, keep them as objects
+			values = converted if converted.dtype.kind not in 'US' else np.array(values, dtype=object)
+		nulls = pd.isna(values) if values.dtype.kind in 'OfmM' else np.zeros(len(values), dtype=bool)
+		styles = np.full(len(values), None, dtype=object)
+		active = np.ones(len(values), dtype=bool)
+		for op, check_value, true_style, false_style, quit in self._rules:
+			check = self._check_array(op, values, check_value) & ~nulls
+			if true_style: styles[active & check] = true_style
+			if false_style: styles[active & ~check] = false_style
+			if quit: active &= ~check
+		return styles
+	
+	@staticmethod
+	def _check_array(op, values: np.ndarray, check_value) -> np.ndarray:
+		""" The condition for all values, values that can not be compared give False"""
+		if values.dtype.kind in 'biuf':
+			try:
+				return np.asarray(op(values, check_value), dtype=bool)
+			except TypeError:
+				pass
 		
+		def check(value):
+			try:
+				return bool(op(value, check_value))
+			except TypeError:
+				return False
+		return np.frompyfunc(check, 1, 1)(values).astype(bool)
+	
 	def do_cond_format(self, value):
-		if self.value is None:
-			check = False
-		for cond_format in self.cond_formats:
-			if cond_format['cond'] in ["gt",">"] and self.value > cond_format["check_value"]: check=True
-			elif cond_format['cond'] in ["gte",">="] and self.value >= cond_format["check_value"]: check=True
-			elif cond_format['cond'] in ["st","<"] and self.value < cond_format["check_value"]: check=True
-			elif cond_format['cond'] in ["ste","<="] and self.value <= cond_format["check_value"]: check=True
-			elif cond_format['cond'] in ["eq","="|"=="] and self.value == cond_format["check_value"]: check=True
-			elif cond_format['cond'] in ["neq","!="] and self.value != cond_format["check_value"]: check=True
-			else: check = False
-			if check:
-				nw_style = cond_format.get('true', None)
-				if nw_style: self.widget.set_style(f'{self.property}:{nw_style}')
-				if cond_format.get('qit', False):
-					return
-			else:
-				nw_style = cond_format.get('false', None)
-				if nw_style: self.widget.set_style(f'{self.property}:{nw_style}')
-
-		return
+		""" Sets the style property of the widget for the value, the widget is not touched when nothing changes"""
+		nw_style = self.evaluate(value)
+		if nw_style is None or nw_style == self._applied_style: return
+		self._applied_style = nw_style
+		self.widget.set_style(f'{self.property}:{nw_style}')
 
 
 class DataLabel(gui.Container):
@@ -487,16 +1711,21 @@ class DataLabel(gui.Container):
 	default_field_style = 'width:auto;height:auto;font-size:1.0em'
 	default_input_style = 'width:auto;height:auto;font-size:1.0em;border-style:solid;border-width:2px;border-color:black'
 	
+	dispatcher = None
+	""" UpdateDispatcher collecting the refresh(dp) calls, None applies them right away"""
+	
 	config = {'fields':[{'name':'name', 'position':'left'},
 						{'name':'value', 'position':'50%'},
 						{'name':'input', 'position':'right', 'is_input':True}]}
 	
-	def __init__(self, fields=None, input_fields=None, field_pos=None, style='', **kwargs):
+	def __init__(self, fields=None, input_fields=None, field_pos=None, style='', template=None, **kwargs):
 		"""
 		:param fields:			A dictionary with the fieldnames (key) and per field a dictionary with the value, style and other field information
 		:param input_fields:	A string or list[str], containing the names of the fields that must be ready to accept input (RW)
 		:param field_pos:		An list[int] for the position of the different fields, in %.
 								Omitting will result in auto positioning through the style settings
+		:param template:		DataLabelTemplate with the prepared layout, fields, input_fields and style are not used.
+								Keyword arguments with a fieldname set the value of that field, see DataLabelTemplate.create
 						
 		lbl = DataLabel(naam='test', groep='measurements', waarde=2.15, input_fields='waarde', update_fields='waarde' ,
 						field_pos=[0,20,40], style='position:absolute;left:5%;top:5%')
@@ -504,42 +1733,231 @@ class DataLabel(gui.Container):
 							   'groep':{'value':'measurements', 'style':'left:30%'},
 							   'waarde':{'value':2.15, 'style':'left:60%', style='background:yellow', is_updated:True},
 							   'input':{style:'background:orange', is_input:True}})
+		
+		Optional format specs per field, compiled once (see compile_format):
+			'precision':	Number of decimals for numbers
+			'unit':			Unit shown after numbers, like kWh
+			'thousands':	Thousands separator for numbers, True or ',' (2,350.5), '.' (2.350,5) or ' '
+			'bool_text':	Texts for True and False, like ('AAN', 'UIT')
+		lbl = DataLabel(fields={'waarde':{'value':2350.5, 'precision':1, 'unit':'kWh', 'thousands':'.'},
+							   'pomp':{'value':True, 'bool_text':('AAN', 'UIT')}})
 		:examples:
 		lbl.waarde = 2.35
 		lbl.update({'waarde':2.35})
+		lbl.update(waarde=2.35, groep='other')
 		lbl.update(2.35)
 		
 		"""
-		self.style = update_css_stylestr(self.cont_style, style)
-		super().__init__(style=self.style, **kwargs)
+		if template is None:
+			# a template of its own, the label keeps the fields dict that was passed
+			template = DataLabelTemplate(fields, input_fields, style, label_class=type(self), **kwargs)
+			self.fields = template.fields
+			widget_kwargs = {key: value for key, value in kwargs.items() if key not in ('update_fields', 'is_updated')}
+		else:
+			# the values of the fields are set per label, the layout is shared
+			self.fields = {fieldname: dict(field) for fieldname, field in template.fields.items()}
+			for fieldname in template.fields.keys() & kwargs.keys(): self.fields[fieldname]['value'] = kwargs[fieldname]
+			widget_kwargs = {key: value for key, value in kwargs.items() if key not in template.fields}
+		self.template = template
+		super().__init__(style=template.style, **widget_kwargs)
+		
+		self.field_widgets = {}
+		""" per fieldname: the Label (TextInput for an input field) showing the field"""
+		self._field_texts = {}
+		""" per fieldname: the text the widget of the field shows"""
+		self._field_values = {}
+		""" per fieldname: the value the text was formatted from, the same value again needs no formatting"""
+		self._formatters = template.formatters
+		""" per fieldname: the compiled format spec, a callable returning the text for a value"""
+		for fieldname, is_input, field_style in template.field_layout:
+			value = self.fields[fieldname].get('value', '')
+			text = self._formatters[fieldname](value)
+			if not is_input:
+				lbl = gui.Label(text=text, style=field_style)
+			else:
+				lbl = gui.TextInput(style=field_style)
+				lbl.set_text(text)
+				lbl.onchange.connect(self.onchange)
+			self.append(lbl, fieldname)
+			self.field_widgets[fieldname] = lbl
+			self._field_texts[fieldname] = text
+			self._field_values[fieldname] = value
+		
+		self.update_field = template.update_field
+		""" The field set by update with a single value, see DataLabelTemplate._find_update_field"""
+	
+	def __getattr__(self, name):
+		# only called when the normal lookup fails, the values of the fields can be read as attributes
+		fields = self.__dict__.get('fields', {})
+		if name in fields: return fields[name].get('value')
+		raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+	
+	def __setattr__(self, name, value):
+		# lbl.waarde = 2.35 updates the field, unless the name is an attribute of the widget itself
+		if name in self.__dict__.get('field_widgets', ()) and name not in self.__dict__ and not hasattr(type(self), name):
+			self._set_field(name, value)
+		else:
+			super().__setattr__(name, value)
+	
+	def update(self, values=None, **kwargs):
+		"""
+		Sets the values of one or more fields. Only the widgets of fields that get another text are changed,
+		so remi sends nothing for values that did not change.
+		:param values:	dict with per fieldname the new value, or a single value for the update_field
+		:param kwargs:	The new values as fieldname=value, in addition to (or instead of) the dict
+		:raises KeyError: When a fieldname is not a field of the label
+		:raises ValueError: For a single value when the label has no update_field
+		"""
+		if values is not None and not isinstance(values, dict):
+			if self.update_field is None:
+				raise ValueError('The DataLabel has no field for an update with a single value, pass update_fields...')
+			values = {self.update_field: values}
+		for fieldname, value in {**(values or {}), **kwargs}.items():
+			self._set_field(fieldname, value)
+	
+	@staticmethod
+	def compile_format(field: dict) -> Callable:
+		"""
+		Compiles the format spec of a field (precision, unit, thousands, bool_text, see __init__) into a callable
+		returning the text for a value. Without a spec the callable is str.
+		"""
+		precision, unit = field.get('precision', None), field.get('unit', None)
+		thousands, bool_text = field.get('thousands', None), field.get('bool_text', None)
+		if precision is None and not unit and not thousands and not bool_text: return str
 		
-		if fields is not None:
-			self.fields = fields
+		spec = (',' if thousands else '') + (f'.{precision}f' if precision is not None else '')
+		# python formats 2,350.5, swap the separators for other conventions
+		translation = {'.': str.maketrans({',': '.', '.': ','}), ' ': str.maketrans({',': ' '})}.get(thousands, None)
+		suffix = f' {unit}' if unit else ''
+		
+		def format_value(value) -> str:
+			if isinstance(value, (bool, np.bool_)):
+				return (bool_text[0] if value else bool_text[1]) if bool_text else str(value)
+			if not isinstance(value, (int, float, np.number)): return str(value)
+			text = format(value, spec) if spec else str(value)
+			if translation is not None: text = text.translate(translation)
+			return text + suffix
+		return format_value
+	
+	def _set_field(self, fieldname: str, value):
+		""" Stores the new value of a field and sets the text of its widget when the text changes"""
+		if fieldname not in self.field_widgets: raise KeyError(f'{fieldname} is not a field of the DataLabel...')
+		self.fields[fieldname]['value'] = value
+		last_value = self._field_values[fieldname]
+		# the same value (True is not 1) gives the same text
+		if type(last_value) is type(value) and last_value == value: return
+		self._field_values[fieldname] = value
+		text = self._formatters[fieldname](value)
+		if text == self._field_texts[fieldname]: return
+		self._field_texts[fieldname] = text
+		self.field_widgets[fieldname].set_text(text)
+	
+	def refresh(self, dp=None, *args, **kwargs):
+		"""
+		For datapoints that call the refresh method of their subscribed widgets, sets the update_field to the value
+		of the datapoint (through the dispatcher when there is one)
+		:param dp: The calling datapoint, its value property is used
+		:raises ValueError: When the label has no update_field
+		"""
+		if not dp: return
+		if self.update_field is None:
+			raise ValueError('The DataLabel has no field for an update with a single value, pass update_fields...')
+		if self.dispatcher is not None:
+			self.dispatcher.submit(self, dp.value)
 		else:
-			self.fields = {}
-			
+			self.update(dp.value)
+	
+	@decorate_event
+	def onchange(self, emitter, new_value:str):
+		# the input field shows what the user typed now, an update with the previous value must set it again
+		fieldname = next((name for name, widget in self.field_widgets.items() if widget is emitter), None)
+		if fieldname is not None:
+			self.fields[fieldname]['value'] = new_value
+			self._field_values[fieldname] = new_value
+			self._field_texts[fieldname] = new_value
+		return (new_value,)
+
+
+class DataLabelTemplate(object):
+	"""
+	The layout of a DataLabel prepared once: the merged style strings of the label and its fields (parsed into style
+	dicts), the fields with their compiled format specs and the update_field. create() stamps out labels with that
+	layout, only their widgets are created. For screens with hundreds of labels that look the same.
+
+		template = DataLabelTemplate(fields={'naam':{'style':'position:absolute;left:5%'},
+											 'waarde':{'style':'position:absolute;left:60%', 'precision':2, 'unit':'kWh'}},
+									 style='position:relative;width:300px;height:20px')
+		labels = [template.create(naam=dp.name, waarde=dp.value) for dp in datapoints]
+	"""
+	
+	def __init__(self, fields=None, input_fields=None, style='', label_class=None, **kwargs):
+		"""
+		:param fields:			See DataLabel, the values are the defaults of the labels
+		:param input_fields:	See DataLabel
+		:param style:			Style string for the labels
+		:param label_class:		The class of the labels, DataLabel (default) or a subclass
+		:param kwargs:			fieldname=value, fields with the default style.
+								update_fields (or is_updated) is not a field, but the name or list of names of the
+								fields to mark is_updated.
+		:raises ValueError:		When an update field is not a field of the label
+		"""
+		self.label_class = label_class if label_class is not None else DataLabel
+		cls = self.label_class
+		kwargs = dict(kwargs)
+		update_fields, is_updated = kwargs.pop('update_fields', None), kwargs.pop('is_updated', None)
+		update_fields = update_fields or is_updated
+		self.fields = fields if fields is not None else {}
 		for fieldname, fieldvalue in kwargs.items():
-			self.fields[fieldname] = {'value':fieldvalue, 'is_input':False, 'is_updated':False, 'style':self.default_field_style}
+			self.fields[fieldname] = {'value':fieldvalue, 'is_input':False, 'is_updated':False, 'style':cls.default_field_style}
 		
 		if input_fields:
 			if type(input_fields) is not list: input_fields = [input_fields]
 			for inp_field in input_fields:
 				if inp_field in self.fields:
 					self.fields[inp_field]['is_input'] = True
-					
-					
-		for fieldname, field in self.fields.items():
-			if not field.get('is_input', False):
-				lbl = gui.Label(text=str(field.get('value','')), style=update_css_stylestr(self.default_field_style, field.get('style','')))
-			else:
-				lbl = gui.TextInput(style=update_css_stylestr(self.default_input_style, field.get('style','')))
-				lbl.set_text(str(field.get('value','')))
-				lbl.onchange.connect(self.onchange)
-			self.append(lbl)
 		
-	@decorate_event
-	def onchange(self, emitter, new_value:str):
-		return (new_value,)
+		if update_fields:
+			if type(update_fields) is not list: update_fields = [update_fields]
+			for upd_field in update_fields:
+				if upd_field not in self.fields: raise ValueError(f'Update field {upd_field} is not a field of the DataLabel...')
+				self.fields[upd_field]['is_updated'] = True
+		
+		self.style = self.style_dict(update_css_stylestr(cls.cont_style, style))
+		self.field_layout = []
+		""" per field: (fieldname, is_input, style dict)"""
+		for fieldname, field in self.fields.items():
+			is_input = field.get('is_input', False)
+			default_style = cls.default_input_style if is_input else cls.default_field_style
+			self.field_layout.append((fieldname, is_input, self.style_dict(update_css_stylestr(default_style, field.get('style','')))))
+		self.formatters = {fieldname: cls.compile_format(field) for fieldname, field in self.fields.items()}
+		self.update_field = self._find_update_field(self.fields)
+	
+	@staticmethod
+	def _find_update_field(fields: dict) -> Union[str, None]:
+		"""
+		The field set by update with a single value (and by refresh): the first field with is_updated, otherwise the
+		field 'value', otherwise the last field that is not an input field (the value comes after name and group).
+		None when the label has no such field.
+		"""
+		update_field = next((name for name, field in fields.items() if field.get('is_updated', False)), None)
+		if update_field is None and 'value' in fields: update_field = 'value'
+		if update_field is None:
+			update_field = next((name for name, field in reversed(fields.items()) if not field.get('is_input', False)), None)
+		return update_field
+	
+	@staticmethod
+	def style_dict(style: str) -> dict:
+		""" Parses a CSS style string into a dict, remi takes a dict without parsing it again for every widget"""
+		return {key.strip(): value.strip() for key, value in
+				(item.split(':', 1) for item in style.split(';') if item.strip())}
+	
+	def create(self, values: dict = None, **kwargs):
+		"""
+		Returns a new label with the layout of the template
+		:param values:	dict with per fieldname the value of the new label, fields not mentioned get the template value
+		:param kwargs:	fieldname=value as alternative for the dict, other keyword arguments go to the widget
+		"""
+		return self.label_class(template=self, **{**(values or {}), **kwargs})
 
 
 class MultilineLabel(gui.Widget):
@@ -560,15 +1978,168 @@ class MultilineLabel(gui.Widget):
 		if self.text: self.set_value(self.text, **kwargs)
 	
 	def set_value(self, text: str, **kwargs):
-		self.empty()
 		list_style = kwargs.pop('list_style', 'square')
-		self.markdown_html = markdown.markdown(dedent(text), output_format='html')
-		self.markdown_html = self.markdown_html.replace('<li>',
-														f'<li style="display:list-item;list-style:{list_style};background-color:transparent">')
-		self.add_child(str(id(self.markdown_html)), self.markdown_html)
+		self.text = text
+		markdown_html = self.render_markdown(text, list_style)
+		# the same html again, no need to bother the browser
+		if markdown_html == self.markdown_html: return
+		self.markdown_html = markdown_html
+		self.add_child('markdown', self.markdown_html)
+	
+	_converter = markdown.Markdown(output_format='html')
+	""" One markdown converter for all MultilineLabels, building a new one for every text is expensive"""
+	_converter_lock = threading.Lock()
+	
+	@staticmethod
+	@functools.lru_cache(maxsize=256)
+	def render_markdown(text: str, list_style: str = 'square') -> str:
+		"""
+		Turns the markdown text into html, the results are cached (LRU) as status panels mostly show the same texts
+		:param text: 		The Markdown text
+		:param list_style: 	The list-style of the list items
+		:return: the html
+		"""
+		with MultilineLabel._converter_lock:
+			markdown_html = MultilineLabel._converter.reset().convert(dedent(text))
+		return markdown_html.replace('<li>', f'<li style="display:list-item;list-style:{list_style};background-color:transparent">')
+
+
+class RingBuffer(object):
+	"""
+	Fixed size FIFO buffer of float values (optionally with timestamps) backed by NumPy. Every value is stored twice,
+	at its slot and at slot + length, so the values in their order (oldest first) are always one contiguous slice:
+	push is O(1) and the ordered view (values) is never a copy.
+	"""
+	
+	def __init__(self, length: int, fill: float = 0, timestamps: bool = False):
+		"""
+		:param length: 		Number of values in the buffer
+		:param fill: 		Initial value of all slots
+		:param timestamps: 	Keep a timestamp (seconds since the epoch) with every value
+		"""
+		self.fill = fill
+		self._values = np.full(2 * length, fill, dtype=float)
+		self._times = np.full(2 * length, np.nan) if timestamps else None
+		self._head = 0
+		""" The slot for the next value, also the slot of the oldest value"""
+		self.count = 0
+		""" The number of values pushed, at most length"""
+		self.version = 0
+		""" Incremented on every change, to find out if the data changed since a previous look"""
+	
+	def __len__(self):
+		return len(self._values) // 2
+	
+	def __getitem__(self, item):
+		return self.values[item]
+	
+	@property
+	def values(self) -> np.ndarray:
+		""" Read only view with the values, the oldest value first"""
+		view = self._values[self._head:self._head + len(self)]
+		view.flags.writeable = False
+		return view
+	
+	@property
+	def times(self) -> Union[np.ndarray, None]:
+		""" Read only view with the timestamps of the values (NaN for the initial fill), None without timestamps"""
+		if self._times is None: return None
+		view = self._times[self._head:self._head + len(self)]
+		view.flags.writeable = False
+		return view
+	
+	@property
+	def last(self) -> float:
+		""" The newest value"""
+		return self._values[self._head - 1 + len(self)].item()
+	
+	def push(self, value: float, timestamp: float = None):
+		"""
+		Adds a value, the oldest value drops out
+		:param value: 		The new value, None is stored as NaN
+		:param timestamp: 	(timestamps) Time of the value in seconds since the epoch, default now
+		"""
+		length = len(self)
+		value = np.nan if value is None else value
+		self._values[self._head] = self._values[self._head + length] = value
+		if self._times is not None:
+			self._times[self._head] = self._times[self._head + length] = time.time() if timestamp is None else timestamp
+		self._head = (self._head + 1) % length
+		self.count = min(self.count + 1, length)
+		self.version += 1
+	
+	def extend(self, values, timestamps=None):
+		"""
+		Adds a batch of values in one go (vectorized), only the newest length values are kept
+		:param values: 		Sequence of values, oldest first
+		:param timestamps: 	(timestamps) Sequence with a timestamp per value, default now for all values
+		"""
+		length = len(self)
+		values = np.asarray(values, dtype=float)[-length:]
+		if self._times is not None:
+			timestamps = np.full(len(values), time.time()) if timestamps is None else np.asarray(timestamps, dtype=float)[-length:]
+		count = len(values)
+		if not count: return
+		# the slots of the new values, each slot is written at both of its positions
+		slots = (self._head + np.arange(count)) % length
+		for slot_offset in (0, length):
+			self._values[slots + slot_offset] = values
+			if self._times is not None: self._times[slots + slot_offset] = timestamps
+		self._head = (self._head + count) % length
+		self.count = min(self.count + count, length)
+		self.version += 1
+	
+	def decimated(self, max_points: int) -> tuple:
+		"""
+		Min/max decimation of the values to at most max_points points: the values are divided in max_points // 2
+		buckets and of every bucket the minimum and the maximum are kept, in their original order. So peaks stay
+		visible however long the buffer is. A bucket with only NaN values gives NaN (a gap).
+		:param max_points: 	The maximum number of points, at least 2
+		:return: (positions of the points in the buffer, values of the points), both NumPy arrays
+		"""
+		values = self.values
+		count = len(values)
+		if count <= max_points: return np.arange(count), values
+		buckets = max(max_points // 2, 1)
+		size = -(-count // buckets)
+		padded = np.full(buckets * size, np.nan)
+		padded[:count] = values
+		padded = padded.reshape(buckets, size)
+		empty = np.isnan(padded).all(axis=1)
+		start = np.arange(buckets) * size
+		minimum = start + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+		maximum = start + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+		positions = np.stack([np.minimum(minimum, maximum), np.maximum(minimum, maximum)], axis=1).ravel()
+		positions = np.minimum(positions, count - 1)
+		result = values[positions]
+		result[np.repeat(empty, 2)] = np.nan
+		return positions, result
+	
+	def resize(self, length: int):
+		"""
+		Changes the number of values in the buffer, the newest values are kept. A larger buffer is filled up
+		with the fill value before the existing history.
+		"""
+		if length == len(self): return
+		keep = min(length, len(self))
+		values = np.full(2 * length, self.fill, dtype=float)
+		values[length - keep:length] = self.values[len(self) - keep:]
+		values[2 * length - keep:] = values[length - keep:length]
+		if self._times is not None:
+			times = np.full(2 * length, np.nan)
+			times[length - keep:length] = self.times[len(self) - keep:]
+			times[2 * length - keep:] = times[length - keep:length]
+			self._times = times
+		self._values = values
+		self._head = 0
+		self.count = min(self.count, length)
+		self.version += 1
 
 
 class ALB_widget(gui.Container):
+	dispatcher = None
+	""" UpdateDispatcher collecting the refresh(dp) calls, None applies them right away"""
+	
 	@property
 	def alb_value(self):
 		return self._alb_value
@@ -595,16 +2166,54 @@ class ALB_widget(gui.Container):
 	
 	@property
 	def value(self):
-		return self._data_buffer[-1]
+		value = self._data_buffer.last
+		# None values are stored as NaN
+		return None if np.isnan(value) else value
 	
 	@value.setter
 	def value(self, nw_value):
-		self._data_buffer = self._data_buffer[1:] + [nw_value]
-		self.update_chart()
+		self.update({self.series[0]: nw_value})
+	
+	@property
+	def data_buffer(self):
+		""" The RingBuffer with the charted values (of the first series)"""
+		return self._data_buffer
+	
+	@property
+	def _data_buffer(self):
+		return self._buffers[self.series[0]]
+	
+	@property
+	def data_buffer_length(self):
+		return len(self._data_buffer)
+	
+	@data_buffer_length.setter
+	def data_buffer_length(self, nw_length):
+		# the newest values are kept
+		for buffer in self._buffers.values(): buffer.resize(nw_length)
+		self.request_render()
+	
+	def update(self, values: dict, timestamp: float = None):
+		"""
+		Adds a value to one or more series and updates the chart once
+		:param values: 		dict with per series name the new value
+		:param timestamp: 	Time of the values in seconds since the epoch, default now (only used with timestamps)
+		"""
+		for series, value in values.items(): self._buffers[series].push(value, timestamp)
+		self.request_render()
+	
+	def extend(self, values, timestamps=None):
+		"""
+		Adds a batch of values to the data buffer and updates the chart once
+		:param values: 		Sequence of values, oldest first
+		:param timestamps: 	Sequence with a timestamp (seconds since the epoch) per value, default now
+		"""
+		self._data_buffer.extend(values, timestamps)
+		self.request_render()
 	
 	def __init__(self, name: str, value: float = 11, min_value: int = 0, max_value: int = 25, alb_value: int = 20,
-				 alb_state: bool = False, data_buffer_length: int = 100,
-				 width: int = 300, height: int = 600, **kwargs):
+				 alb_state: bool = False, data_buffer_length: int = 100, timestamps: bool = False, max_fps: float = 0,
+				 render_mode: str = 'full', max_points: int = None, width: int = 300, height: int = 600, **kwargs):
 		"""
 		Displays a chart (typically for charting a current on L1, L2 or L3) with an ALB (active load balancing) pushbutton.
 		Upon activation of the ALB button a slider will be displayed controlling the setting of a limit/threshold line (the ALB threshold)
@@ -614,7 +2223,18 @@ class ALB_widget(gui.Container):
 		:param max_value: Maximum displayed value (y-axis)
 		:param alb_value: ALB threshold, can be set/read using the alb_value property of the widget
 		:param alb_state: ALB state, subsequent can be set/read using the alb_state property
-		:param data_buffer_length: Length of the data buffer displayed by the chart, the buffer acts as a FIFO (queue)
+		:param data_buffer_length: Length of the data buffer displayed by the chart, the buffer acts as a FIFO (queue).
+									Can be changed at runtime, the newest values are kept
+		:param timestamps: Keep a timestamp with every value in the data buffer (see RingBuffer)
+		:param max_fps: Render the chart at most this many times a second, values can be set at any rate. Renders are
+						skipped when the data did not change or the widget is hidden, the last value is always rendered.
+						0 (default) renders the chart for every new value.
+		:param render_mode: 'full' (default) renders the complete pygal chart for every update. 'incremental' renders
+						the chart frame (axes, guides) once and only changes the d attribute of an svg path on top of
+						it, so an update sends a few hundred bytes to the browser instead of the whole svg document.
+		:param max_points: Longer data buffers are decimated to this number of points before charting, keeping the
+						minimum and maximum of every part of the buffer (see RingBuffer.decimated). None (default)
+						uses the width in pixels, 0 charts all values.
 		:param width: Width of the widget in pixels (no percentages at this point)
 		:param height: Height of the widget in pixels (no percentages at this point)
 		:param kwargs: Style string passed to the container div tag
@@ -635,8 +2255,23 @@ class ALB_widget(gui.Container):
 		self.style['height'] = f'{self.height}px'
 		
 		self.name = name
-		self.data_buffer_length = data_buffer_length
-		self._data_buffer = [0] * self.data_buffer_length
+		# a subclass can chart more than one series
+		if not getattr(self, 'series', None): self.series = [name]
+		self._buffers = {series: RingBuffer(data_buffer_length, timestamps=timestamps) for series in self.series}
+		self.max_fps = max_fps
+		self._rendered_version = None
+		self._last_render = 0.0
+		self._render_timer = None
+		self._render_lock = threading.Lock()
+		self.render_mode = render_mode
+		self.max_points = max_points if max_points is not None else width
+		self._frame_key = None
+		""" (incremental mode) The data buffer length the chart frame was rendered for"""
+		self._path_scale = None
+		""" (incremental mode) x offset, x step, y offset and y scale to turn the values into path coordinates"""
+		self.chart_paths = {}
+		""" (incremental mode) per series the svg path showing the values"""
+		self.chart_path = None
 		self._min_value = min_value
 		self._max_value = max_value
 		if min_value <= alb_value <= max_value:
@@ -685,6 +2320,8 @@ class ALB_widget(gui.Container):
 		# self.alb_switch = None
 		self.slider_line_indicator = None
 		self.alb_value_lbl = None
+		self._threshold_widgets = []
+		""" The sliders and threshold lines, only visible when ALB is active"""
 		self.chart = None
 		
 		self.build()
@@ -714,38 +2351,70 @@ class ALB_widget(gui.Container):
 										'font-size:1.0em')
 		# self.name_lbl.onclick.connect(self.onALBstate_change)
 		
+		lines, sliders = self._build_thresholds()
+		self.main_cont.append([self.chart_cont] + lines + [self.name_lbl] + sliders)
+		self.append(self.main_cont)
+		
+		self.onALBstate_change(self.name_lbl, self.alb_state)
+		self.update_chart()
+	
+	def _build_thresholds(self) -> tuple:
+		"""
+		Creates the slider and the threshold line for the ALB threshold
+		:return: (list of threshold lines, list of slider containers) to add to the main container
+		"""
+		self.slide_cont, self.alb_slider, self.slider_line_indicator, self.alb_value_lbl = \
+			self._build_threshold(self.alb_value)
+		self.alb_slider.onchange.connect(self.onALBvalue_change)
+		self.onALBvalue_change(self.alb_slider, str(self.alb_value))
+		return [self.slider_line_indicator], [self.slide_cont]
+	
+	def _build_threshold(self, alb_value: int, left: float = 0, color: str = 'black') -> tuple:
+		"""
+		Creates a slider to set an ALB threshold and the line that shows it
+		:param alb_value:	The initial threshold
+		:param left:		Position of the slider from the left side in pixels
+		:param color:		Color of the line and its label
+		:return: (slider container, slider, line, label with the threshold value)
+		"""
 		# The slider to set the ALB treshold is contained within ist own container
 		bottom_offset = int(17 - (self.height / 100))
 		top_offset = int(17 - (self.height / 100))
 		slider_width = self.height / 12
 		
-		self.slide_cont = gui.Container(style=f'position:absolute;top:{top_offset}px;left:0%;'
-											  f'height:{self.height - bottom_offset - top_offset}px;width:{slider_width}px;'
-											  'background-color:transparent')
+		slide_cont = gui.Container(style=f'position:absolute;top:{top_offset}px;left:{left}px;'
+										 f'height:{self.height - bottom_offset - top_offset}px;width:{slider_width}px;'
+										 'background-color:transparent')
 		
-		self.alb_slider = gui.Slider(default_value=str(self.alb_value), min=self.min_value, max=self.max_value, step=1,
-									 style='position:relative;width:100%;height:100%')
-		self.alb_slider.add_class('alb-slider')
+		alb_slider = gui.Slider(default_value=str(alb_value), min=self.min_value, max=self.max_value, step=1,
+								style='position:relative;width:100%;height:100%')
+		alb_slider.add_class('alb-slider')
 		
-		self.alb_slider.attributes['orient'] = 'vertical'
-		self.slide_cont.append(self.alb_slider)
-		self.alb_slider.onchange.connect(self.onALBvalue_change)
+		alb_slider.attributes['orient'] = 'vertical'
+		slide_cont.append(alb_slider)
 		
 		# The line indicator for the ALB level
-		self.slider_line_indicator = gui.Container(style=f'position:absolute;left:0%;width:100%;'
-														 'background-color:transparent;border-style:dashed none none none;'
-														 'border-color:black;border-width:2px')
-		self.alb_value_lbl = gui.Label(text=f'{self.alb_value}',
-									   style=f'position:absolute;top:0%;right:0%;font-size:1.0em')
-		self.slider_line_indicator.append(self.alb_value_lbl)
-		self.onALBvalue_change(self.alb_slider, str(self.alb_value))
-		
-		self.main_cont.append(
-			[self.chart_cont, self.slider_line_indicator, self.name_lbl, self.slide_cont])
-		self.append(self.main_cont)
+		line_indicator = gui.Container(style=f'position:absolute;left:0%;width:100%;'
+											 'background-color:transparent;border-style:dashed none none none;'
+											 f'border-color:{color};border-width:2px')
+		value_lbl = gui.Label(text=f'{alb_value}', style=f'position:absolute;top:0%;right:0%;font-size:1.0em;color:{color}')
+		line_indicator.append(value_lbl)
+		self._threshold_widgets.extend([slide_cont, line_indicator])
+		return slide_cont, alb_slider, line_indicator, value_lbl
+	
+	def _position_threshold(self, line_indicator, alb_value: int):
+		""" Moves a threshold line to the height of the ALB threshold"""
+		factor = (alb_value - self.min_value) / (self.max_value - self.min_value)
 		
-		self.onALBstate_change(self.name_lbl, self.alb_state)
-		self.update_chart()
+		# offset1 = self.height/15			# bottom offset
+		# offset2 = self.height/15			# top offset
+		offset1 = int(22 + (self.height / 100))  # bottom offset
+		offset2 = int(22 + (self.height / 100))  # top offset
+		height = factor * (self.height - offset1 - offset2) + offset1
+		# height = int(int(nw_value)*(self.height-offset1-offset2)/self.max_value) + offset1
+		top = self.height - height
+		line_indicator.css_height = f'{height}px'
+		line_indicator.css_top = f'{top}px'
 	
 	def set_content(self, chart):
 		'''
@@ -764,19 +2433,143 @@ class ALB_widget(gui.Container):
 		:param kwargs:
 		:return:
 		"""
-		if dp: self.value = dp.value
+		if not dp: return
+		if self.dispatcher is not None:
+			# applied together with the other widgets in the next dispatch
+			self.dispatcher.submit(self, dp.value)
+		else:
+			self.value = dp.value
+	
+	def request_render(self):
+		"""
+		Asks for a render of the chart after new data. With max_fps a render that comes too soon after the previous
+		one is postponed (by a timer), later requests in the meantime are handled by that same render.
+		"""
+		if not self.max_fps:
+			self.update_chart()
+			return
+		with self._render_lock:
+			# a pending render will pick up the new data
+			if self._render_timer is not None: return
+			delay = self._last_render + 1 / self.max_fps - time.monotonic()
+			if delay > 0:
+				self._render_timer = threading.Timer(delay, self._render_pending)
+				self._render_timer.daemon = True
+				self._render_timer.start()
+				return
+		self._render_pending()
+	
+	def _render_pending(self):
+		"""
+		(max_fps) Renders the chart, unless the data did not change. While the widget is hidden the render stays
+		pending, it is checked again every frame and done as soon as the widget is shown.
+		"""
+		with self._render_lock:
+			self._render_timer = None
+			self._last_render = time.monotonic()
+			if self._data_version() == self._rendered_version: return
+			if not self._is_visible():
+				self._render_timer = threading.Timer(1 / self.max_fps, self._render_pending)
+				self._render_timer.daemon = True
+				self._render_timer.start()
+				return
+		app = _get_app(self)
+		# a render from the timer thread must not interfere with remi updating the browser
+		with app.update_lock if hasattr(app, 'update_lock') else contextlib.nullcontext():
+			self.update_chart()
+	
+	def _data_version(self) -> int:
+		""" Changes whenever the data of one of the series changes"""
+		return sum(buffer.version for buffer in self._buffers.values())
+	
+	def _is_visible(self) -> bool:
+		"""
+		False when the widget or one of its parents is hidden by its style. A widget that is not on a page (yet)
+		counts as visible, there is no way to notice it being added to a page later.
+		"""
+		widget = self
+		while isinstance(widget, gui.Tag):
+			if widget.style.get('display') == 'none' or widget.style.get('visibility') == 'hidden': return False
+			widget = widget.get_parent()
+		return True
 	
 	def update_chart(self):
-		# Create a DateTimeLine chart
+		self._rendered_version = self._data_version()
+		if self.render_mode == 'incremental':
+			self._update_chart_path()
+			return
 		
+		# Create a DateTimeLine chart
 		self.chart = Line(config=self.chart_config, style=self.chart_style)
-		self.chart.add(self.name, self._data_buffer)
+		# the chart has no x labels, so the decimated points can be spread evenly
+		for series in self.series: self.chart.add(series, self._chart_points(series)[1])
 		self.chart.value_formatter = lambda x: f'{x:.1f}'
 		# self.chart.x_value_formatter = lambda dt: dt.strftime(Best_dtFormat.get(self.dataselection, "%d-%m %H:%M"))
 		self.set_content(self.chart)
 	
 	# print('chart_children:', len(self.chart_cont.children))
 	
+	def _render_frame(self):
+		"""
+		(incremental mode) Renders the pygal chart without a visible line and puts an svg with an empty path on top
+		of it. The pygal view of the plot area gives the scale to turn the values into path coordinates.
+		"""
+		length = len(self._data_buffer)
+		chart = Line(config=self.chart_config, style=self.chart_style)
+		for series in self.series: chart.add(series, [self.min_value] * length, stroke=False)
+		chart.setup()
+		view, margin = chart.view, chart.margin_box
+		self.chart_data = chart.svg.render(is_unicode=True)
+		chart.teardown()
+		self.chart_cont.add_child("chart", self.chart_data)
+		
+		x_step = (view.x(1) - view.x(0)) / (length - 1) if length > 1 else 0
+		y_scale = (view.y(self.max_value) - view.y(self.min_value)) / ((self.max_value - self.min_value) or 1)
+		self._path_scale = (view.x(0) if length > 1 else view.x(.5), x_step, view.y(self.min_value), y_scale)
+		
+		if not self.chart_paths:
+			overlay = gui.Svg(style='position:absolute;top:0%;left:0%;width:100%;height:100%;pointer-events:none')
+			overlay.set_viewbox(0, 0, self.width, self.height)
+			plot = gui.SvgGroup()
+			for nr, series in enumerate(self.series):
+				path = gui.SvgPath()
+				path.attributes['fill'] = 'none'
+				path.attributes['stroke'] = self.chart_style.colors[nr % len(self.chart_style.colors)]
+				path.attributes['stroke-width'] = str(self.chart_style.stroke_width)
+				path.attributes['stroke-linejoin'] = 'round'
+				plot.append(path)
+				self.chart_paths[series] = path
+			self.chart_path = self.chart_paths[self.series[0]]
+			overlay.append(plot)
+			self.chart_cont.add_child("overlay", overlay)
+		self.chart_path.get_parent().attributes['transform'] = f'translate({margin.left}, {margin.top})'
+		self._frame_key = length
+	
+	def _chart_points(self, series: str) -> tuple:
+		""" Returns (positions in the buffer, values) of the points to chart for a series, decimated when needed"""
+		buffer = self._buffers[series]
+		if not self.max_points or len(buffer) <= self.max_points: return np.arange(len(buffer)), buffer.values
+		return buffer.decimated(self.max_points)
+	
+	def _update_chart_path(self):
+		""" (incremental mode) Turns the values into the d attribute of the paths, a None value leaves a gap"""
+		if self._frame_key != len(self._data_buffer): self._render_frame()
+		x_offset, x_step, y_offset, y_scale = self._path_scale
+		for series in self.series:
+			positions, values = self._chart_points(series)
+			xs = x_offset + x_step * positions
+			ys = y_offset + y_scale * (values - self.min_value)
+			commands = []
+			move = True
+			for x, y in zip(xs.tolist(), ys.tolist()):
+				if y != y:
+					move = True
+					continue
+				commands.append(f'{"M" if move else "L"}{x:.1f} {y:.1f}')
+				move = False
+			# unchanged paths are not send to the browser again
+			self.chart_paths[series].attributes['d'] = ' '.join(commands)
+	
 	# @decorate_set_on_listener("(self, emitter, item, new_value, row, column)")
 	@decorate_event
 	def onALBvalue_change(self, emitter, nw_value: str):
@@ -788,17 +2581,7 @@ class ALB_widget(gui.Container):
 		"""
 		# print(nw_value)
 		nw_value = int(float(nw_value))
-		factor = (nw_value - self.min_value) / (self.max_value - self.min_value)
-		
-		# offset1 = self.height/15			# bottom offset
-		# offset2 = self.height/15			# top offset
-		offset1 = int(22 + (self.height / 100))  # bottom offset
-		offset2 = int(22 + (self.height / 100))  # top offset
-		height = factor * (self.height - offset1 - offset2) + offset1
-		# height = int(int(nw_value)*(self.height-offset1-offset2)/self.max_value) + offset1
-		top = self.height - height
-		self.slider_line_indicator.css_height = f'{height}px'
-		self.slider_line_indicator.css_top = f'{top}px'
+		self._position_threshold(self.slider_line_indicator, nw_value)
 		self.alb_value = int(nw_value)
 		self.alb_value_lbl.set_text(f'{self.alb_value}')
 		return (self.alb_value,)
@@ -812,15 +2595,193 @@ class ALB_widget(gui.Container):
 			
 		if not nw_state:
 			self.name_lbl.set_style('color:black')
-			self.slider_line_indicator.style['visibility'] = 'hidden'
-			self.slide_cont.style['visibility'] = 'hidden'
+			for widget in self._threshold_widgets: widget.style['visibility'] = 'hidden'
 		else:
 			self.name_lbl.set_style('color:red')
-			self.slider_line_indicator.style['visibility'] = 'visible'
-			self.slide_cont.style['visibility'] = 'visible'
+			for widget in self._threshold_widgets: widget.style['visibility'] = 'visible'
 		return (nw_state,)
 
 
+class MultiALB_widget(ALB_widget):
+	"""
+	ALB_widget showing several series (typically the currents on L1, L2 and L3) in one chart, every series with its
+	own ALB threshold. All series get their new values with a single update() call per sample tick, so the chart is
+	rendered once per tick instead of once per series.
+	"""
+	
+	@property
+	def value(self):
+		""" dict with per series the newest value"""
+		return {series: None if np.isnan(buffer.last) else buffer.last for series, buffer in self._buffers.items()}
+	
+	@value.setter
+	def value(self, nw_values: dict):
+		self.update(nw_values)
+	
+	def __init__(self, names: list[str], name: str = '', alb_values: Union[dict, int] = 20, **kwargs):
+		"""
+		:param names: 		The names of the series, their order sets the colors of the lines
+		:param name: 		The name shown on top of the chart, default the series names
+		:param alb_values: 	ALB threshold per series name (dict), or one threshold for all series
+		:param kwargs: 		See ALB_widget.__init__(), the alb_value is not used
+
+		:raises onALBvalue_change: raised when one of the ALB tresholds is adjusted.
+		To connect: onALBvalue_change.connect(handling routine, *args, **kwargs),
+		signature: (emitter:MultiALB_widget, nwvalue:int, series:str)
+		"""
+		self.series = list(names)
+		if not isinstance(alb_values, dict): alb_values = {series: alb_values for series in self.series}
+		self.alb_values = {series: alb_values.get(series, 20) for series in self.series}
+		self.alb_sliders = {}
+		self.alb_lines = {}
+		self.alb_value_lbls = {}
+		kwargs.pop('alb_value', None)
+		super(MultiALB_widget, self).__init__(name or '/'.join(self.series), alb_value=self.alb_values[self.series[0]],
+											  **kwargs)
+	
+	def extend(self, values: dict, timestamps=None):
+		"""
+		Adds a batch of values to one or more series and updates the chart once
+		:param values: 		dict with per series name a sequence of values, oldest first
+		:param timestamps: 	Sequence with a timestamp (seconds since the epoch) per value, default now
+		"""
+		for series, series_values in values.items(): self._buffers[series].extend(series_values, timestamps)
+		self.request_render()
+	
+	def _build_thresholds(self) -> tuple:
+		""" Creates a slider and a threshold line (in the color of the series) for every series, side by side"""
+		lines, sliders = [], []
+		slider_width = self.height / 12
+		for nr, series in enumerate(self.series):
+			color = self.chart_style.colors[nr % len(self.chart_style.colors)]
+			slide_cont, slider, line, value_lbl = self._build_threshold(self.alb_values[series], nr * slider_width, color)
+			self.alb_sliders[series], self.alb_lines[series], self.alb_value_lbls[series] = slider, line, value_lbl
+			slider.onchange.connect(self.onALBvalue_change, series)
+			self.onALBvalue_change(slider, str(self.alb_values[series]), series)
+			lines.append(line)
+			sliders.append(slide_cont)
+		# the ALB_widget attributes refer to the first series
+		first = self.series[0]
+		self.alb_slider, self.slider_line_indicator, self.alb_value_lbl = \
+			self.alb_sliders[first], self.alb_lines[first], self.alb_value_lbls[first]
+		self.slide_cont = sliders[0]
+		return lines, sliders
+	
+	@decorate_event
+	def onALBvalue_change(self, emitter, nw_value: str, series: str = None):
+		"""Event for the change of an ALB threshold.
+
+		Args:
+			emitter (SliderWidget): The emitter of the event.
+			nw_value (string): The new value of the slider.
+			series (string): The series of the threshold.
+		"""
+		series = series if series is not None else self.series[0]
+		nw_value = int(float(nw_value))
+		self._position_threshold(self.alb_lines[series], nw_value)
+		self.alb_values[series] = nw_value
+		if series == self.series[0]: self.alb_value = nw_value
+		self.alb_value_lbls[series].set_text(f'{nw_value}')
+		return (nw_value, series)
+
+
+class UpdateDispatcher(object):
+	"""
+	Collects the value updates for many DataLabel and ALB_widget instances during a tick and applies them in one pass.
+	A newer value for the same field (or series) of a widget replaces the pending one, superseded values never reach
+	the widget. The pass holds the update_lock of the App, so remi sends the changes of the whole tick together in its
+	next update cycle instead of interleaving them with a poll cycle that is still busy.
+
+	Attached widgets (see attach) pass the refresh(dp) calls of their datapoints to the dispatcher. Apply the pending
+	updates by calling dispatch, for instance from App.idle, or let a timer thread do it (start).
+
+		dispatcher = UpdateDispatcher(app, interval=1)
+		dispatcher.attach(*labels, chart)
+		dispatcher.start()
+		...
+		dispatcher.submit(lbl, 2.35)
+		dispatcher.submit(lbl, 'measurements', field='groep')
+	"""
+	
+	def __init__(self, app=None, interval: float = 1.0):
+		"""
+		:param app: 		The remi App of the widgets, its update_lock is held during a dispatch.
+							Default: the App is looked up from the widgets
+		:param interval: 	Seconds between the dispatches of the timer thread (see start)
+		"""
+		self.app = app
+		self.interval = interval
+		self._pending = {}
+		""" per id() of a widget: (widget, dict with per field or series the newest value)"""
+		self._lock = threading.Lock()
+		self._stop = threading.Event()
+		self._thread = None
+	
+	def attach(self, *widgets):
+		""" Lets the widgets pass their refresh(dp) calls to this dispatcher"""
+		for widget in widgets: widget.dispatcher = self
+	
+	def detach(self, *widgets):
+		""" The widgets apply their refresh(dp) calls right away again, their pending updates are dropped"""
+		with self._lock:
+			for widget in widgets:
+				widget.dispatcher = None
+				self._pending.pop(id(widget), None)
+	
+	def submit(self, widget, value, field: str = None):
+		"""
+		Registers a new value for a widget, it replaces a pending value for the same field
+		:param widget: 	DataLabel or ALB_widget (MultiALB_widget)
+		:param value: 	The new value, a dict with per field (series) a value sets several fields at once
+		:param field: 	The field of a DataLabel or the series of an ALB_widget, default the update_field of the
+						DataLabel or the first series of the ALB_widget
+		"""
+		if not isinstance(value, dict): value = {field if field is not None else self._default_field(widget): value}
+		with self._lock:
+			self._pending.setdefault(id(widget), (widget, {}))[1].update(value)
+	
+	@staticmethod
+	def _default_field(widget) -> str:
+		""" The field (DataLabel) or series (ALB_widget) a single value is meant for"""
+		if isinstance(widget, ALB_widget): return widget.series[0]
+		return widget.update_field
+	
+	def dispatch(self) -> int:
+		"""
+		Applies the pending updates, every widget gets one update call with the newest values
+		:return: The number of updated widgets
+		"""
+		with self._lock:
+			pending, self._pending = self._pending, {}
+		if not pending: return 0
+		app = self.app if self.app is not None else _get_app(next(iter(pending.values()))[0])
+		with app.update_lock if hasattr(app, 'update_lock') else contextlib.nullcontext():
+			for widget, values in pending.values():
+				# one failing widget must not cost the other widgets their update, nor stop the timer thread
+				try:
+					widget.update(values)
+				except Exception:
+					_logger.exception(f'Update of {type(widget).__name__} {widget.identifier} with {values} failed')
+		return len(pending)
+	
+	def start(self):
+		""" Starts a daemon thread dispatching every interval seconds"""
+		if self._thread is not None and self._thread.is_alive(): return
+		self._stop.clear()
+		self._thread = threading.Thread(target=self._run, daemon=True)
+		self._thread.start()
+	
+	def stop(self):
+		""" Stops the thread after a last dispatch"""
+		self._stop.set()
+		if self._thread is not None: self._thread.join()
+		self._thread = None
+	
+	def _run(self):
+		while not self._stop.wait(self.interval): self.dispatch()
+		self.dispatch()
+
+
 class PushBtn(gui.Widget):
 	
 	@property
@@ -835,9 +2796,15 @@ class PushBtn(gui.Widget):
 		else:
 			self.style['opacity'] = '1.0'
 	
-	def __init__(self, text='', initial_state=False, initial_locked=False, *args, **kwargs):
+	def __init__(self, text='', initial_state=False, initial_locked=False, *args, css_state: bool = False, **kwargs):
+		"""
+		:param css_state:	Show the state only through the pushbtn attribute (on/off) of the button, the styles of the
+							states are in remi_pushbtn.css. A state change is then one attribute update instead of
+							several inline style updates on the child widgets.
+		"""
 		super().__init__(_type='div', _class='pushbtn', *args, **kwargs)
 		self._locked = False
+		self.css_state = css_state
 		self.attributes['pushbtn'] = 'off'
 		
 		self.press = gui.Widget(_class='press')
@@ -888,6 +2855,9 @@ class PushBtn(gui.Widget):
 	
 	def __set_switch(self, state):
 		if self.locked: return
+		if self.css_state:
+			self.attributes['pushbtn'] = 'on' if state else 'off'
+			return
 		if state:
 			self.attributes['pushbtn'] = 'on'
 			self.press.style['border-style'] = 'solid solid double solid'
@@ -913,9 +2883,16 @@ class Switch(gui.Widget):
 		else:
 			self.style['opacity'] = '1.0'
 	
-	def __init__(self, on_text='', off_text='', initial_state=False, initial_locked=False, *args, **kwargs):
+	def __init__(self, on_text='', off_text='', initial_state=False, initial_locked=False, *args, css_state: bool = False,
+				 **kwargs):
+		"""
+		:param css_state:	Show the state only through the switch attribute (on/off) of the switch, the styles of the
+							states are in remi_switch.css. A state change is then one attribute update instead of
+							several inline style updates on the child widgets.
+		"""
 		super().__init__(_type='div', _class='switch', *args, **kwargs)
 		self._locked = False
+		self.css_state = css_state
 		self.slider = gui.Widget(_class='thumb')
 		
 		self.light = gui.Widget(_class='light')
@@ -971,6 +2948,9 @@ class Switch(gui.Widget):
 	
 	def __set_switch(self, state):
 		if self.locked: return
+		if self.css_state:
+			self.attributes['switch'] = 'on' if state else 'off'
+			return
 		if state:
 			self.attributes['switch'] = 'on'
 			self.style["align-items"] = "flex-start"